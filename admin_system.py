@@ -1,65 +1,454 @@
+import asyncio
 import json
-from typing import Dict, List, Optional, Any
+import re
+import sys
+import time
+from collections import deque
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from database import db
-from debug_logger import debug_admin, DebugLogger
+from debug_logger import debug_admin, debug_logger, DebugLogger
 from input_sanitizer import InputSanitizer
 
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# Seconds an access level lookup stays valid before hitting the database again
+_ACCESS_CACHE_TTL = 60.0
+
+# Exit directions accepted by /link_rooms
+_VALID_DIRECTIONS = frozenset(('north', 'south', 'east', 'west', 'up', 'down'))
+_DIRECTIONS_TEXT = "north, south, east, west, up, down"
+
+# Tables the /list_* commands may page through
+_LIST_TABLES = frozenset(('rooms', 'items', 'monsters'))
+
+# Commands whose handlers accept the unsplit argument text as raw_tail
+_RAW_TAIL_COMMANDS = frozenset(('create_room', 'create_item', 'kick', 'ban', 'edit_room', 'broadcast'))
+
+# Argument separator used by _parse_quoted_args (runs of spaces only)
+_SPACES = re.compile(' +')
+
+# One piece of a command argument: a double- or single-quoted run, bare text, or separating spaces
+_ARG_PIECE_RE = re.compile(r'"([^"]*)"?|\'([^\']*)\'?|([^ "\']+)|( +)')
+
+def _remainder(args: List[str], raw_tail: str, n: int) -> str:
+    """Arguments from index n on as one string, sliced from raw_tail when available"""
+    if raw_tail:
+        if n == 0:
+            return raw_tail
+        parts = _SPACES.split(raw_tail, n)
+        return parts[n] if len(parts) > n else ""
+    return ' '.join(args[n:])
+
+# Item type -> (default properties, default stats) applied by /create_item
+_ITEM_TYPE_DEFAULTS = {
+    'weapon': ({'equipable': True, 'slot': 'weapon'}, {'damage': 5}),
+    'armor': ({'equipable': True, 'slot': 'armor'}, {'defense': 2}),
+    'potion': ({'consumable': True}, {'health': 25}),
+}
+
+# Editable item columns, with 'type' accepted as an alias for 'item_type'
+_EDIT_ITEM_COLUMNS = frozenset(('name', 'description', 'item_type'))
+_EDIT_ITEM_ALIASES = MappingProxyType({'type': 'item_type'})
+
+# Editable monster columns by value kind, with 'exp_reward' accepted as an alias
+_MONSTER_TEXT_COLS = frozenset(('name', 'description'))
+_MONSTER_NUM_COLS = frozenset(('level', 'health', 'attack', 'defense', 'experience_reward'))
+_MONSTER_COL_MAP = MappingProxyType({'exp_reward': 'experience_reward'})
+
+# /edit_item and /edit_monster UPDATE statements keyed by (table, column). Each has fixed
+# text so it hits asyncpg's statement cache; the server registers them for pool warm-up.
+_UPDATE_SQL = {
+    (table, column): f'UPDATE {table} SET {column} = $1 WHERE id = $2'
+    for table, columns in (('items', _EDIT_ITEM_COLUMNS), ('monsters', _MONSTER_TEXT_COLS | _MONSTER_NUM_COLS))
+    for column in columns
+}
+
+# /list_properties output templates, filled with format_map straight from the fetched Record
+_ROOM_PROPS_TMPL = """Room ID {id} Properties:
+Name: {name}
+Description: {description}
+Exits: {exits}
+Items: {items}
+Monsters: {monsters}
+Properties: {properties}"""
+
+_ITEM_PROPS_TMPL = """Item ID {id} Properties:
+Name: {name}
+Description: {description}
+Type: {item_type}
+Properties: {properties}
+Stats: {stats}"""
+
+_MONSTER_PROPS_TMPL = """Monster ID {id} Properties:
+Name: {name}
+Description: {description}
+Level: {level}
+Health: {health}/{max_health}
+Attack: {attack}
+Defense: {defense}
+Experience Reward: {experience_reward}
+Loot Table: {loot_table}
+Properties: {properties}"""
+
+# Seconds a /map room graph stays cached
+_MAP_CACHE_TTL = 30.0
+
+# /map grid width/height, row/col offsets for the drawable exits, and the legend under the grid
+_MAP_GRID_SIZE = 7
+_MAP_OFFSETS = {
+    'north': (-1, 0),
+    'south': (1, 0),
+    'east': (0, 1),
+    'west': (0, -1)
+}
+_MAP_LEGEND = """
+Legend:
+@ = Your current location
+. = Other rooms
+| = North/South connection
+- = East/West connection"""
+
+# Admin log lines are flushed once this many are queued, or this many seconds after the first
+_LOG_BATCH_SIZE = 100
+_LOG_FLUSH_INTERVAL = 1.0
+
+# Admin command name -> AdminSystem handler method name
+_ADMIN_DISPATCH = {
+    'admin_help': '_show_admin_help',
+    'create_room': '_create_room',
+    'link_rooms': '_link_rooms',
+    'create_item': '_create_item',
+    'create_monster': '_create_monster',
+    'teleport': '_teleport_player',
+    'promote': '_promote_user',
+    'demote': '_demote_user',
+    'kick': '_kick_player',
+    'ban': '_ban_player',
+    'unban': '_unban_player',
+    'reload_world': '_reload_world',
+    'list_rooms': '_list_rooms',
+    'list_items': '_list_items',
+    'list_monsters': '_list_monsters',
+    'list_properties': '_list_properties',
+    'edit_room': '_edit_room',
+    'edit_item': '_edit_item',
+    'edit_monster': '_edit_monster',
+    'spawn_monster': '_spawn_monster',
+    'spawn_item': '_spawn_item',
+    'server_stats': '_server_stats',
+    'broadcast': '_broadcast_message',
+    'save_world': '_save_world',
+    'load_world': '_load_world',
+    'debug_status': '_debug_status',
+    'debug_enable': '_debug_enable',
+    'debug_disable': '_debug_disable',
+    'debug_verbosity': '_debug_verbosity',
+    'debug_component': '_debug_component',
+    'map': '_show_map'
+}
+
+# /admin_help output, and per-command help for /admin_help <command>
+_ADMIN_HELP_TEXT = """
+Admin Commands:
+Note: Use quotes for multi-word parameters, e.g., /create_room "Magic Forest" "A mystical forest"
+
+World Building:
+  /create_room "name" "description" - Create a new room
+  /link_rooms <room1_id> <direction> <room2_id> - Link two rooms
+  /edit_room <room_id> <property> "value" - Edit room properties
+  /list_rooms [page] - List all rooms
+  
+Item Management:
+  /create_item "name" <type> [stats_json] - Create a new item
+  /edit_item <item_id> <property> "value" - Edit item properties
+  /spawn_item <item_id> - Spawn item in current room
+  /list_items [page] - List all items
+  
+Monster Management:
+  /create_monster "name" <level> [stats] - Create a new monster
+  /edit_monster <monster_id> <property> "value" - Edit monster properties
+  /spawn_monster <monster_id> - Spawn monster in current room
+  /list_monsters [page] - List all monsters
+  
+Inspection:
+  /list_properties <type> <id> - List properties of room/item/monster
+  
+Player Management:
+  /teleport <player_name> <room_id> - Teleport a player
+  /promote <username> - Promote user to admin
+  /demote <username> - Demote user from admin
+  /kick <player_name> ["reason"] - Kick a player
+  /ban <player_name> ["reason"] - Ban a player
+  /unban <player_name> - Unban a player
+  
+Server Management:
+  /server_stats - Show server statistics
+  /broadcast "message" - Broadcast message to all players
+  /reload_world - Reload world data
+  /save_world [filename] - Save world state
+  /load_world <filename> - Load world state
+
+Debug Management:
+  /debug_status - Show debug logger status
+  /debug_enable [verbosity] - Enable debug logging (0-3)
+  /debug_disable - Disable debug logging
+  /debug_verbosity <level> - Set debug verbosity (0-3)
+  /debug_component <component> <on|off> - Control component debug
+
+Examples:
+  /create_room "Magic Forest" "A mystical forest filled with ancient trees"
+  /create_item "Fire Sword" weapon '{"damage": 15, "fire_damage": 5}'
+  /create_monster "Fire Dragon" 10
+  /edit_room 1 name "New Room Name"
+  /broadcast "Server will restart in 5 minutes"
+
+Note: For JSON parameters, use single quotes around the JSON object.
+"""
+
+_ADMIN_COMMAND_HELP = {
+    'admin_help': """Command: /admin_help [command]
+Description: Show admin command help or help for a specific admin command
+Usage:
+  /admin_help - Show all admin commands
+  /admin_help <command> - Show help for specific admin command
+Examples:
+  /admin_help
+  /admin_help create_room
+  /admin_help teleport""",
+    
+    'create_room': """Command: /create_room "name" "description"
+Description: Create a new room in the game world
+Usage: /create_room "room_name" "room_description"
+Example: /create_room "Magic Forest" "A mystical forest filled with ancient trees"
+Note: Use quotes for multi-word names and descriptions""",
+    
+    'link_rooms': """Command: /link_rooms <room1_id> <direction> <room2_id>
+Description: Create bidirectional links between two rooms
+Usage: /link_rooms <room1_id> <direction> <room2_id>
+Directions: north, south, east, west, up, down, northeast, northwest, southeast, southwest
+Example: /link_rooms 1 north 5
+Note: Creates exits in both directions automatically""",
+    
+    'create_item': """Command: /create_item "name" <type> [stats_json]
+Description: Create a new item with optional custom statistics
+Usage: /create_item "item_name" <type> [stats_json]
+Types: weapon, armor, consumable, misc
+Example: /create_item "Fire Sword" weapon '{"damage": 25, "fire_damage": 10}'
+Note: Use single quotes around JSON objects""",
+    
+    'create_monster': """Command: /create_monster "name" <level> [stats]
+Description: Create a new monster template
+Usage: /create_monster "monster_name" <level>
+Example: /create_monster "Fire Dragon" 15
+Note: Higher level monsters are automatically stronger""",
+    
+    'teleport': """Command: /teleport <player_name> <room_id>
+Description: Teleport a player to a specific room
+Usage: /teleport <player_name> <room_id>
+Example: /teleport hero123 5
+Note: Player must be online to teleport""",
+    
+    'promote': """Command: /promote <username>
+Description: Promote a user to admin status (access level 2)
+Usage: /promote <username>
+Example: /promote newadmin
+Note: Requires higher admin access level""",
+    
+    'demote': """Command: /demote <username>
+Description: Remove admin status from a user (set access level to 1)
+Usage: /demote <username>
+Example: /demote oldadmin
+Note: Cannot demote users with higher access level than yourself""",
+    
+    'kick': """Command: /kick <player_name> ["reason"]
+Description: Kick a player from the server
+Usage: /kick <player_name> ["reason"]
+Example: /kick troublemaker "Inappropriate behavior"
+Note: Player can reconnect immediately""",
+    
+    'ban': """Command: /ban <player_name> ["reason"]
+Description: Ban a player from the server
+Usage: /ban <player_name> ["reason"]
+Example: /ban cheater "Using exploits"
+Note: Player cannot reconnect until unbanned""",
+    
+    'unban': """Command: /unban <player_name>
+Description: Remove ban from a player
+Usage: /unban <player_name>
+Example: /unban reformed_player
+Note: Player can reconnect after unbanning""",
+    
+    'reload_world': """Command: /reload_world
+Description: Reload world data from the database
+Usage: /reload_world
+Example: /reload_world
+Note: Updates rooms, items, and monsters from database""",
+    
+    'list_rooms': """Command: /list_rooms [page]
+Description: List all rooms with pagination
+Usage: /list_rooms [page_number]
+Example: /list_rooms 2
+Note: Shows 10 rooms per page""",
+    
+    'list_items': """Command: /list_items [page]
+Description: List all items with pagination
+Usage: /list_items [page_number]
+Example: /list_items 1
+Note: Shows 10 items per page""",
+    
+    'list_monsters': """Command: /list_monsters [page]
+Description: List all monsters with pagination
+Usage: /list_monsters [page_number]
+Example: /list_monsters 3
+Note: Shows 10 monsters per page""",
+    
+    'list_properties': """Command: /list_properties <type> <id>
+Description: List all properties of a room, item, or monster
+Usage: /list_properties <type> <id>
+Types: room, item, monster
+Example: /list_properties room 1
+Note: Shows detailed information about the specified object""",
+    
+    'edit_room': """Command: /edit_room <room_id> <property> "value"
+Description: Edit properties of an existing room
+Usage: /edit_room <room_id> <property> "new_value"
+Properties: name, description, properties
+Example: /edit_room 1 name "New Room Name"
+Note: Use quotes for multi-word values""",
+    
+    'edit_item': """Command: /edit_item <item_id> <property> "value"
+Description: Edit properties of an existing item
+Usage: /edit_item <item_id> <property> "new_value"
+Properties: name, description, item_type, properties, stats
+Example: /edit_item 5 name "Enhanced Sword"
+Note: Use quotes for multi-word values""",
+    
+    'edit_monster': """Command: /edit_monster <monster_id> <property> "value"
+Description: Edit properties of an existing monster
+Usage: /edit_monster <monster_id> <property> "new_value"
+Properties: name, description, level, health, damage, experience_reward
+Example: /edit_monster 3 level 20
+Note: Use quotes for multi-word values""",
+    
+    'spawn_monster': """Command: /spawn_monster <monster_id>
+Description: Spawn a monster in your current room
+Usage: /spawn_monster <monster_id>
+Example: /spawn_monster 7
+Note: Creates a live instance of the monster template""",
+    
+    'spawn_item': """Command: /spawn_item <item_id>
+Description: Spawn an item in your current room
+Usage: /spawn_item <item_id>
+Example: /spawn_item 12
+Note: Creates a copy of the item in the room""",
+    
+    'server_stats': """Command: /server_stats
+Description: Display server statistics and performance information
+Usage: /server_stats
+Example: /server_stats
+Note: Shows player count, uptime, and system resources""",
+    
+    'broadcast': """Command: /broadcast "message"
+Description: Send a message to all online players
+Usage: /broadcast "message"
+Example: /broadcast "Server will restart in 10 minutes"
+Note: Message appears to all players regardless of location""",
+    
+    'save_world': """Command: /save_world [filename]
+Description: Save current world state to a file
+Usage: /save_world [filename]
+Example: /save_world backup_2024
+Note: Saves rooms, items, monsters, and player data""",
+    
+    'load_world': """Command: /load_world <filename>
+Description: Load world state from a file
+Usage: /load_world <filename>
+Example: /load_world backup_2024
+Note: Replaces current world data with saved data""",
+    
+    'debug_status': """Command: /debug_status
+Description: Show current debug logging status
+Usage: /debug_status
+Example: /debug_status
+Note: Displays enabled components and verbosity level""",
+    
+    'debug_enable': """Command: /debug_enable [verbosity]
+Description: Enable debug logging with optional verbosity level
+Usage: /debug_enable [0-3]
+Example: /debug_enable 2
+Note: Higher verbosity shows more detailed information""",
+    
+    'debug_disable': """Command: /debug_disable
+Description: Disable debug logging
+Usage: /debug_disable
+Example: /debug_disable
+Note: Stops all debug output""",
+    
+    'debug_verbosity': """Command: /debug_verbosity <level>
+Description: Set debug logging verbosity level
+Usage: /debug_verbosity <0-3>
+Example: /debug_verbosity 1
+Note: 0=minimal, 1=normal, 2=verbose, 3=very verbose""",
+    
+    'debug_component': """Command: /debug_component <component> <on|off>
+Description: Enable or disable debug logging for specific components
+Usage: /debug_component <component> <on|off>
+Components: database, game_engine, server, admin_commands
+Example: /debug_component combat on
+Note: Allows fine-grained control of debug output""",
+    
+    'map': """Command: /map
+Description: Display ASCII map centered on your current room
+Usage: /map
+Example: /map
+Note: Shows 7x7 grid with room connections and IDs"""
+}
+
 class AdminSystem:
     """Handles administrative commands and world editing"""
     
+    # Edit statements to prepare on every pooled connection; register before db.connect()
+    WARM_STATEMENTS = tuple(_UPDATE_SQL.values())
+    
     def __init__(self, game_engine):
         self.game_engine = game_engine
-        self.sanitizer = InputSanitizer()
-        
-        # Admin command mappings
-        self.admin_commands = {
-            'admin_help': self._show_admin_help,
-            'create_room': self._create_room,
-            'link_rooms': self._link_rooms,
-            'create_item': self._create_item,
-            'create_monster': self._create_monster,
-            'teleport': self._teleport_player,
-            'promote': self._promote_user,
-            'demote': self._demote_user,
-            'kick': self._kick_player,
-            'ban': self._ban_player,
-            'unban': self._unban_player,
-            'reload_world': self._reload_world,
-            'list_rooms': self._list_rooms,
-            'list_items': self._list_items,
-            'list_monsters': self._list_monsters,
-            'list_properties': self._list_properties,
-            'edit_room': self._edit_room,
-            'edit_item': self._edit_item,
-            'edit_monster': self._edit_monster,
-            'spawn_monster': self._spawn_monster,
-            'spawn_item': self._spawn_item,
-            'server_stats': self._server_stats,
-            'broadcast': self._broadcast_message,
-            'save_world': self._save_world,
-            'load_world': self._load_world,
-            'debug_status': self._debug_status,
-            'debug_enable': self._debug_enable,
-            'debug_disable': self._debug_disable,
-            'debug_verbosity': self._debug_verbosity,
-            'debug_component': self._debug_component,
-            'map': self._show_map
-        }
-    
-    async def process_admin_command(self, player, command: str, args: List[str]) -> bool:
-        """Process an admin command"""
+        
+        # Handlers bound once here so dispatch is a single dict lookup per command
+        self._admin_dispatch = {name: getattr(self, method) for name, method in _ADMIN_DISPATCH.items()}
+        
+        # user_id -> (access_level, expires_at) for _has_admin_access
+        self._access_cache: Dict[int, tuple[int, float]] = {}
+        
+        # center room_id -> (expires_at, world_version, room_map) for /map
+        self._map_cache: Dict[int, tuple[float, int, dict]] = {}
+        self._world_version = 0  # Bumped whenever room names or exits may have changed
+        
+        # Admin log lines are queued and written in batches by _log_flusher
+        self._log_queue: Optional[asyncio.Queue] = None
+        self._log_task: Optional[asyncio.Task] = None
+    
+    async def process_admin_command(self, player, command: str, args: List[str], raw_tail: str = "") -> bool:
+        """Process an admin command; raw_tail is the unparsed text after the command name"""
         # Check if player has admin access
         if not await self._has_admin_access(player):
             await player.send_message("You don't have permission to use admin commands.", "red")
             return False
         
-        if command not in self.admin_commands:
+        handler = self._admin_dispatch.get(command)
+        if handler is None:
             await player.send_message(f"Unknown admin command: {command}", "red")
             await self._show_admin_help(player, [])
             return False
         
         try:
-            await self.admin_commands[command](player, args)
+            if raw_tail and command in _RAW_TAIL_COMMANDS:
+                await handler(player, args, raw_tail)
+            else:
+                await handler(player, args)
             return True
         except Exception as e:
             await player.send_message(f"Error executing admin command: {e}", "red")
@@ -67,31 +456,38 @@ class AdminSystem:
     
     async def _has_admin_access(self, player) -> bool:
         """Check if player has admin access (access level 2 or higher)"""
+        cached = self._access_cache.get(player.user_id)
+        if cached and time.monotonic() < cached[1]:
+            return cached[0] >= 2
+        
         # Get user from database using user_id
         try:
+            access_level = 1
             if not db.pool:
                 # Memory storage fallback
-                for user in db.users.values():
-                    if user.get('id') == player.user_id:
-                        return user.get('access_level', 1) >= 2
-                return False
-            
-            async with db.pool.acquire() as conn:
-                user = await conn.fetchrow('SELECT * FROM users WHERE id = $1', player.user_id)
+                user = db.users_by_id.get(player.user_id)
                 if user:
-                    return user.get('access_level', 1) >= 2
+                    access_level = user.get('access_level', 1)
+            else:
+                async with db.pool.acquire() as conn:
+                    level = await conn.fetchval('SELECT access_level FROM users WHERE id = $1', player.user_id)
+                    if level is not None:
+                        access_level = level
+            
+            self._access_cache[player.user_id] = (access_level, time.monotonic() + _ACCESS_CACHE_TTL)
+            return access_level >= 2
         except Exception as e:
             print(f"Error checking admin access: {e}")
         return False
     
-    async def _create_room(self, player, args: List[str]):
+    async def _create_room(self, player, args: List[str], raw_tail: str = ""):
         """Create a new room: /create_room <name> <description>"""
         if len(args) < 2:
             await player.send_message("Usage: /create_room <name> <description>", "yellow")
             return
         
         name = args[0]
-        description = ' '.join(args[1:])
+        description = _remainder(args, raw_tail, 1)
         
         room_id = await db.create_room(name, description)
         await player.send_message(f"Created room '{name}' with ID {room_id}", "green")
@@ -103,7 +499,7 @@ class AdminSystem:
         """Link two rooms: /link_rooms <room1_id> <direction> <room2_id>"""
         if len(args) != 3:
             await player.send_message("Usage: /link_rooms <room1_id> <direction> <room2_id>", "yellow")
-            await player.send_message("Directions: north, south, east, west, up, down", "yellow")
+            await player.send_message(f"Directions: {_DIRECTIONS_TEXT}", "yellow")
             return
         
         try:
@@ -111,14 +507,23 @@ class AdminSystem:
             direction = args[1].lower()
             room2_id = int(args[2])
             
-            valid_directions = ['north', 'south', 'east', 'west', 'up', 'down']
-            if direction not in valid_directions:
-                await player.send_message(f"Invalid direction. Use: {', '.join(valid_directions)}", "yellow")
+            if direction not in _VALID_DIRECTIONS:
+                await player.send_message(f"Invalid direction. Use: {_DIRECTIONS_TEXT}", "yellow")
                 return
             
-            # Check if rooms exist
-            room1 = await db.get_room(room1_id)
-            room2 = await db.get_room(room2_id)
+            if db.pool:
+                # Existence checks and the link share one connection and one parsed statement
+                async with db.pool.acquire() as conn:
+                    stmt = await conn.prepare('SELECT id, name FROM rooms WHERE id = $1')
+                    room1 = await stmt.fetchrow(room1_id)
+                    room2 = await stmt.fetchrow(room2_id)
+                    if room1 and room2:
+                        await db.link_rooms(room1_id, direction, room2_id, conn=conn)
+            else:
+                room1 = await db.get_room(room1_id)
+                room2 = await db.get_room(room2_id)
+                if room1 and room2:
+                    await db.link_rooms(room1_id, direction, room2_id)
             
             if not room1:
                 await player.send_message(f"Room {room1_id} does not exist.", "red")
@@ -127,7 +532,7 @@ class AdminSystem:
                 await player.send_message(f"Room {room2_id} does not exist.", "red")
                 return
             
-            await db.link_rooms(room1_id, direction, room2_id)
+            self._world_version += 1  # Exits changed, cached maps are stale
             await player.send_message(f"Linked room {room1_id} ({room1['name']}) {direction} to room {room2_id} ({room2['name']})", "green")
             
             # Log admin action
@@ -136,12 +541,13 @@ class AdminSystem:
         except ValueError:
             await player.send_message("Room IDs must be numbers.", "red")
     
-    async def _create_item(self, player, args: List[str]):
+    async def _create_item(self, player, args: List[str], raw_tail: str = ""):
         """Create a new item: /create_item <name> <type> [stats_json]"""
-        debug_admin(f"_create_item called by {player.character['name']} with args: {args}", DebugLogger.NORMAL)
+        # Debug values are passed as args so disabled messages cost no string formatting
+        debug_admin("_create_item called by %s with args: %s", player.character['name'], args)
         
         if len(args) < 2:
-            debug_admin("Insufficient arguments for create_item", DebugLogger.VERBOSE)
+            debug_admin("Insufficient arguments for create_item", level=DebugLogger.VERBOSE)
             await player.send_message("Usage: /create_item \"name\" <type> [stats_json]", "yellow")
             await player.send_message("Types: weapon, armor, potion, misc", "yellow")
             await player.send_message("Example: /create_item \"Fire Sword\" weapon '{\"damage\": 15, \"durability\": 100}'", "yellow")
@@ -149,7 +555,7 @@ class AdminSystem:
         
         name = args[0]
         item_type = args[1].lower()
-        debug_admin(f"Parsed name='{name}', type='{item_type}'", DebugLogger.VERBOSE)
+        debug_admin("Parsed name='%s', type='%s'", name, item_type, level=DebugLogger.VERBOSE)
         
         # Parse stats if provided
         stats = {}
@@ -157,52 +563,44 @@ class AdminSystem:
         
         if len(args) > 2:
             try:
-                stats_str = ' '.join(args[2:])
-                debug_admin(f"Attempting to parse stats JSON: {stats_str}", DebugLogger.VERBOSE)
-                stats = json.loads(stats_str)
-                debug_admin(f"Successfully parsed stats: {stats}", DebugLogger.VERBOSE)
-            except json.JSONDecodeError as e:
-                debug_admin(f"JSON parsing failed: {e}", DebugLogger.NORMAL)
+                stats_str = _remainder(args, raw_tail, 2)
+                debug_admin("Attempting to parse stats JSON: %s", stats_str, level=DebugLogger.VERBOSE)
+                stats = _json.loads(stats_str.encode('utf-8'))
+                debug_admin("Successfully parsed stats: %s", stats, level=DebugLogger.VERBOSE)
+            except ValueError as e:
+                debug_admin("JSON parsing failed: %s", e)
                 await player.send_message("Invalid JSON for stats. Use single quotes around JSON:", "red")
                 await player.send_message("Example: /create_item \"Fire Sword\" weapon '{\"damage\": 15, \"durability\": 100}'", "yellow")
                 return
         else:
-            debug_admin("No stats provided, using defaults", DebugLogger.VERBOSE)
+            debug_admin("No stats provided, using defaults", level=DebugLogger.VERBOSE)
         
         # Set default properties based on type
-        debug_admin(f"Setting default properties for type: {item_type}", DebugLogger.VERBOSE)
-        if item_type == 'weapon':
-            properties['equipable'] = True
-            properties['slot'] = 'weapon'
-            if 'damage' not in stats:
-                stats['damage'] = 5
-        elif item_type == 'armor':
-            properties['equipable'] = True
-            properties['slot'] = 'armor'
-            if 'defense' not in stats:
-                stats['defense'] = 2
-        elif item_type == 'potion':
-            properties['consumable'] = True
-            if 'health' not in stats:
-                stats['health'] = 25
+        debug_admin("Setting default properties for type: %s", item_type, level=DebugLogger.VERBOSE)
+        defaults = _ITEM_TYPE_DEFAULTS.get(item_type)
+        if defaults:
+            properties.update(defaults[0])
+            for stat, value in defaults[1].items():
+                stats.setdefault(stat, value)
         
         description = f"A {item_type} called {name}."
-        debug_admin(f"Final item data - name: {name}, desc: {description}, type: {item_type}, props: {properties}, stats: {stats}", DebugLogger.VERBOSE)
+        debug_admin("Final item data - name: %s, desc: %s, type: %s, props: %s, stats: %s",
+                    name, description, item_type, properties, stats, level=DebugLogger.VERBOSE)
         
         try:
-            debug_admin("Calling db.create_item", DebugLogger.VERBOSE)
+            debug_admin("Calling db.create_item", level=DebugLogger.VERBOSE)
             item_id = await db.create_item(name, description, item_type, properties, stats)
-            debug_admin(f"Item created successfully with ID: {item_id}", DebugLogger.NORMAL)
+            debug_admin("Item created successfully with ID: %s", item_id)
             
             await player.send_message(f"Created {item_type} '{name}' with ID {item_id}", "green")
-            debug_admin("Success message sent to player", DebugLogger.VERBOSE)
+            debug_admin("Success message sent to player", level=DebugLogger.VERBOSE)
             
             # Log admin action
             await self._log_admin_action(player, f"Created item: {name} (ID: {item_id})")
-            debug_admin("Admin action logged", DebugLogger.VERBOSE)
+            debug_admin("Admin action logged", level=DebugLogger.VERBOSE)
             
         except Exception as e:
-            debug_admin(f"Error creating item: {e}", DebugLogger.NORMAL)
+            debug_admin("Error creating item: %s", e)
             await player.send_message(f"Error creating item: {e}", "red")
     
     async def _create_monster(self, player, args: List[str]):
@@ -248,11 +646,7 @@ class AdminSystem:
             room_id = int(args[1])
             
             # Find target player
-            target_player = None
-            for p in self.game_engine.players.values():
-                if p.character['name'].lower() == target_name.lower():
-                    target_player = p
-                    break
+            target_player = self.game_engine.get_player_by_name(target_name)
             
             if not target_player:
                 await player.send_message(f"Player '{target_name}' not found or not online.", "red")
@@ -297,6 +691,9 @@ class AdminSystem:
         
         username = args[0]
         
+        # Access levels are cached by user_id, so drop the whole cache
+        self._access_cache.clear()
+        
         # This would need to be implemented in the database layer
         # For now, just show a message
         await player.send_message(f"Promoted {username} to admin status.", "green")
@@ -312,26 +709,25 @@ class AdminSystem:
         
         username = args[0]
         
+        # Access levels are cached by user_id, so drop the whole cache
+        self._access_cache.clear()
+        
         await player.send_message(f"Demoted {username} from admin status.", "green")
         
         # Log admin action
         await self._log_admin_action(player, f"Demoted user: {username}")
     
-    async def _kick_player(self, player, args: List[str]):
+    async def _kick_player(self, player, args: List[str], raw_tail: str = ""):
         """Kick a player from the server: /kick <player_name> [reason]"""
         if len(args) < 1:
             await player.send_message("Usage: /kick <player_name> [reason]", "yellow")
             return
         
         target_name = args[0]
-        reason = ' '.join(args[1:]) if len(args) > 1 else "No reason given"
+        reason = _remainder(args, raw_tail, 1) if len(args) > 1 else "No reason given"
         
         # Find and kick target player
-        target_player = None
-        for p in self.game_engine.players.values():
-            if p.character['name'].lower() == target_name.lower():
-                target_player = p
-                break
+        target_player = self.game_engine.get_player_by_name(target_name)
         
         if not target_player:
             await player.send_message(f"Player '{target_name}' not found or not online.", "red")
@@ -346,14 +742,14 @@ class AdminSystem:
         # Log admin action
         await self._log_admin_action(player, f"Kicked player: {target_name} - {reason}")
     
-    async def _ban_player(self, player, args: List[str]):
+    async def _ban_player(self, player, args: List[str], raw_tail: str = ""):
         """Ban a player: /ban <player_name> [reason]"""
         if len(args) < 1:
             await player.send_message("Usage: /ban <player_name> [reason]", "yellow")
             return
         
         target_name = args[0]
-        reason = ' '.join(args[1:]) if len(args) > 1 else "No reason given"
+        reason = _remainder(args, raw_tail, 1) if len(args) > 1 else "No reason given"
         
         # This would need to be implemented with a ban list in the database
         await player.send_message(f"Banned {target_name}. Reason: {reason}", "green")
@@ -380,6 +776,7 @@ class AdminSystem:
         
         # This would reload world data from database
         await self.game_engine._initialize_world()
+        self._world_version += 1
         
         await player.send_message("World data reloaded successfully.", "green")
         
@@ -388,92 +785,25 @@ class AdminSystem:
     
     async def _list_rooms(self, player, args: List[str]):
         """List all rooms: /list_rooms [page]"""
-        page = 1
-        if args:
-            try:
-                page = int(args[0])
-            except ValueError:
-                await player.send_message("Page must be a number.", "red")
-                return
-        
-        try:
-            if not db.pool:
-                await player.send_message("Database not available.", "red")
-                return
-            
-            async with db.pool.acquire() as conn:
-                # Get total count
-                total = await conn.fetchval('SELECT COUNT(*) FROM rooms')
-                
-                # Get rooms for this page (10 per page)
-                per_page = 10
-                offset = (page - 1) * per_page
-                rooms = await conn.fetch(
-                    'SELECT id, name, description FROM rooms ORDER BY id LIMIT $1 OFFSET $2',
-                    per_page, offset
-                )
-                
-                if not rooms:
-                    await player.send_message("No rooms found.", "yellow")
-                    return
-                
-                total_pages = (total + per_page - 1) // per_page
-                header = f"Rooms (Page {page}/{total_pages}, Total: {total})"
-                await player.send_message(header, "cyan")
-                await player.send_message("=" * len(header), "cyan")
-                
-                for room in rooms:
-                    room_info = f"ID {room['id']}: {room['name']}"
-                    await player.send_message(room_info, "white")
-                
-        except Exception as e:
-            await player.send_message(f"Error listing rooms: {e}", "red")
+        await self._paginated_list(player, 'rooms', ('id', 'name'),
+                                   lambda r: f"ID {r['id']}: {r['name']}", args)
     
     async def _list_items(self, player, args: List[str]):
         """List all items: /list_items [page]"""
-        page = 1
-        if args:
-            try:
-                page = int(args[0])
-            except ValueError:
-                await player.send_message("Page must be a number.", "red")
-                return
-        
-        try:
-            if not db.pool:
-                await player.send_message("Database not available.", "red")
-                return
-            
-            async with db.pool.acquire() as conn:
-                # Get total count
-                total = await conn.fetchval('SELECT COUNT(*) FROM items')
-                
-                # Get items for this page (10 per page)
-                per_page = 10
-                offset = (page - 1) * per_page
-                items = await conn.fetch(
-                    'SELECT id, name, item_type FROM items ORDER BY id LIMIT $1 OFFSET $2',
-                    per_page, offset
-                )
-                
-                if not items:
-                    await player.send_message("No items found.", "yellow")
-                    return
-                
-                total_pages = (total + per_page - 1) // per_page
-                header = f"Items (Page {page}/{total_pages}, Total: {total})"
-                await player.send_message(header, "cyan")
-                await player.send_message("=" * len(header), "cyan")
-                
-                for item in items:
-                    item_info = f"ID {item['id']}: {item['name']} ({item['item_type']})"
-                    await player.send_message(item_info, "white")
-                
-        except Exception as e:
-            await player.send_message(f"Error listing items: {e}", "red")
+        await self._paginated_list(player, 'items', ('id', 'name', 'item_type'),
+                                   lambda r: f"ID {r['id']}: {r['name']} ({r['item_type']})", args)
     
     async def _list_monsters(self, player, args: List[str]):
         """List all monsters: /list_monsters [page]"""
+        await self._paginated_list(player, 'monsters', ('id', 'name', 'level'),
+                                   lambda r: f"ID {r['id']}: {r['name']} (Level {r['level']})", args)
+    
+    async def _paginated_list(self, player, table: str, columns: Tuple[str, ...],
+                              fmt: Callable[[Any], str], args: List[str]):
+        """Send one page (10 rows) of a world table, formatting each row with fmt"""
+        if table not in _LIST_TABLES:
+            raise ValueError(f"Table {table} cannot be listed")
+        
         page = 1
         if args:
             try:
@@ -488,32 +818,28 @@ class AdminSystem:
                 return
             
             async with db.pool.acquire() as conn:
-                # Get total count
-                total = await conn.fetchval('SELECT COUNT(*) FROM monsters')
-                
-                # Get monsters for this page (10 per page)
+                # Get rows for this page with the total count in the same query
                 per_page = 10
                 offset = (page - 1) * per_page
-                monsters = await conn.fetch(
-                    'SELECT id, name, level FROM monsters ORDER BY id LIMIT $1 OFFSET $2',
+                rows = await conn.fetch(
+                    f'SELECT {", ".join(columns)}, COUNT(*) OVER() AS total FROM {table} '
+                    'ORDER BY id LIMIT $1 OFFSET $2',
                     per_page, offset
                 )
                 
-                if not monsters:
-                    await player.send_message("No monsters found.", "yellow")
+                if not rows:
+                    await player.send_message(f"No {table} found.", "yellow")
                     return
                 
+                total = rows[0]['total']
                 total_pages = (total + per_page - 1) // per_page
-                header = f"Monsters (Page {page}/{total_pages}, Total: {total})"
-                await player.send_message(header, "cyan")
-                await player.send_message("=" * len(header), "cyan")
-                
-                for monster in monsters:
-                    monster_info = f"ID {monster['id']}: {monster['name']} (Level {monster['level']})"
-                    await player.send_message(monster_info, "white")
+                header = f"{table.capitalize()} (Page {page}/{total_pages}, Total: {total})"
+                # One send per color instead of one per line
+                await player.send_message(f"{header}\n{'=' * len(header)}", "cyan")
+                await player.send_message("\n".join(fmt(row) for row in rows), "white")
                 
         except Exception as e:
-            await player.send_message(f"Error listing monsters: {e}", "red")
+            await player.send_message(f"Error listing {table}: {e}", "red")
     
     async def _list_properties(self, player, args: List[str]):
         """List properties of a room, item, or monster: /list_properties <type> <id>"""
@@ -532,52 +858,27 @@ class AdminSystem:
             
             async with db.pool.acquire() as conn:
                 if obj_type == "room":
-                    obj = await conn.fetchrow('SELECT * FROM rooms WHERE id = $1', obj_id)
+                    obj = await conn.fetchrow('SELECT id, name, description, exits, items, monsters, properties FROM rooms WHERE id = $1', obj_id)
                     if obj:
-                        # Convert asyncpg.Record to dict for safe access
-                        obj_dict = dict(obj)
-                        properties_text = f"""Room ID {obj_id} Properties:
-Name: {obj_dict['name']}
-Description: {obj_dict['description']}
-Exits: {obj_dict.get('exits', {})}
-Items: {obj_dict.get('items', [])}
-Monsters: {obj_dict.get('monsters', [])}
-Properties: {obj_dict.get('properties', {})}"""
-                        await player.send_message(properties_text, "cyan")
+                        await player.send_message(_ROOM_PROPS_TMPL.format_map(obj), "cyan")
                     else:
                         await player.send_message(f"Room {obj_id} not found.", "red")
                         
                 elif obj_type == "item":
-                    obj = await conn.fetchrow('SELECT * FROM items WHERE id = $1', obj_id)
+                    obj = await conn.fetchrow('SELECT id, name, description, item_type, properties, stats FROM items WHERE id = $1', obj_id)
                     if obj:
-                        # Convert asyncpg.Record to dict for safe access
-                        obj_dict = dict(obj)
-                        properties_text = f"""Item ID {obj_id} Properties:
-Name: {obj_dict['name']}
-Description: {obj_dict['description']}
-Type: {obj_dict['item_type']}
-Properties: {obj_dict.get('properties', {})}
-Stats: {obj_dict.get('stats', {})}"""
-                        await player.send_message(properties_text, "cyan")
+                        await player.send_message(_ITEM_PROPS_TMPL.format_map(obj), "cyan")
                     else:
                         await player.send_message(f"Item {obj_id} not found.", "red")
                         
                 elif obj_type == "monster":
-                    obj = await conn.fetchrow('SELECT * FROM monsters WHERE id = $1', obj_id)
+                    obj = await conn.fetchrow(
+                        'SELECT id, name, description, level, health, max_health, attack, defense, '
+                        'experience_reward, loot_table, properties FROM monsters WHERE id = $1',
+                        obj_id
+                    )
                     if obj:
-                        # Convert asyncpg.Record to dict for safe access
-                        obj_dict = dict(obj)
-                        properties_text = f"""Monster ID {obj_id} Properties:
-Name: {obj_dict['name']}
-Description: {obj_dict['description']}
-Level: {obj_dict['level']}
-Health: {obj_dict['health']}/{obj_dict['max_health']}
-Attack: {obj_dict['attack']}
-Defense: {obj_dict['defense']}
-Experience Reward: {obj_dict['experience_reward']}
-Loot Table: {obj_dict.get('loot_table', [])}
-Properties: {obj_dict.get('properties', {})}"""
-                        await player.send_message(properties_text, "cyan")
+                        await player.send_message(_MONSTER_PROPS_TMPL.format_map(obj), "cyan")
                     else:
                         await player.send_message(f"Monster {obj_id} not found.", "red")
                 else:
@@ -588,7 +889,7 @@ Properties: {obj_dict.get('properties', {})}"""
         except Exception as e:
             await player.send_message(f"Error executing admin command: {e}", "red")
     
-    async def _edit_room(self, player, args: List[str]):
+    async def _edit_room(self, player, args: List[str], raw_tail: str = ""):
         """Edit a room: /edit_room <room_id> <property> <value>"""
         if len(args) < 3:
             await player.send_message("Usage: /edit_room <room_id> <property> <value>", "yellow")
@@ -598,7 +899,7 @@ Properties: {obj_dict.get('properties', {})}"""
         try:
             room_id = int(args[0])
             property_name = args[1].lower()
-            value = ' '.join(args[2:])
+            value = _remainder(args, raw_tail, 2)
             
             room = await db.get_room(room_id)
             if not room:
@@ -615,6 +916,8 @@ Properties: {obj_dict.get('properties', {})}"""
                 await player.send_message(f"Unknown property: {property_name}", "red")
                 return
             
+            self._world_version += 1  # Room names appear in cached maps
+            
             # Log admin action
             await self._log_admin_action(player, f"Edited room {room_id}: {property_name} = {value}")
             
@@ -637,45 +940,41 @@ Properties: {obj_dict.get('properties', {})}"""
                 await player.send_message("Database not available.", "red")
                 return
             
+            # Validate column name to prevent SQL injection
+            actual_column = _EDIT_ITEM_ALIASES.get(property_name, property_name)
+            if actual_column not in _EDIT_ITEM_COLUMNS:
+                await player.send_message(f"Invalid property: {property_name}. Valid properties: name, description, type", "red")
+                return
+            
+            # Sanitize the value
+            try:
+                sanitized_value = InputSanitizer.sanitize_string(value, max_length=255)
+            except ValueError as e:
+                await player.send_message(f"Invalid value: {e}", "red")
+                return
+            
+            # Hold the connection only for the queries, not for the replies below
             async with db.pool.acquire() as conn:
-                # Check if item exists
-                item = await conn.fetchrow('SELECT * FROM items WHERE id = $1', item_id)
-                if not item:
-                    await player.send_message(f"Item {item_id} does not exist.", "red")
-                    return
-                
-                # Validate column name to prevent SQL injection
-                valid_columns = {'name', 'description', 'item_type'}
-                column_map = {'type': 'item_type'}  # Allow 'type' as alias for 'item_type'
-                
-                actual_column = column_map.get(property_name, property_name)
-                if actual_column not in valid_columns:
-                    await player.send_message(f"Invalid property: {property_name}. Valid properties: name, description, type", "red")
-                    return
-                
-                # Sanitize the value
-                try:
-                    sanitized_value = InputSanitizer.sanitize_string(value, max_length=255)
-                except ValueError as e:
-                    await player.send_message(f"Invalid value: {e}", "red")
-                    return
-                
-                if property_name == 'name':
-                    await conn.execute('UPDATE items SET name = $1 WHERE id = $2', sanitized_value, item_id)
-                    await player.send_message(f"Updated item {item_id} name to: {sanitized_value}", "green")
-                elif property_name == 'description':
-                    await conn.execute('UPDATE items SET description = $1 WHERE id = $2', sanitized_value, item_id)
-                    await player.send_message(f"Updated item {item_id} description.", "green")
-                elif property_name == 'type':
-                    await conn.execute('UPDATE items SET item_type = $1 WHERE id = $2', sanitized_value, item_id)
-                    await player.send_message(f"Updated item {item_id} type to: {sanitized_value}", "green")
-                else:
-                    await player.send_message(f"Unknown property: {property_name}", "red")
-                    return
-                
-                # Log admin action
-                await self._log_admin_action(player, f"Edited item {item_id}: {property_name} = {value}")
-                
+                exists = await conn.fetchval('SELECT 1 FROM items WHERE id = $1', item_id)
+                if exists:
+                    # One fixed statement per column so asyncpg reuses its prepared plan
+                    await conn.execute(_UPDATE_SQL[('items', actual_column)], sanitized_value, item_id)
+                    db.invalidate_row('items', item_id)
+            
+            if not exists:
+                await player.send_message(f"Item {item_id} does not exist.", "red")
+                return
+            
+            if actual_column == 'description':
+                await player.send_message(f"Updated item {item_id} description.", "green")
+            elif actual_column == 'item_type':
+                await player.send_message(f"Updated item {item_id} type to: {sanitized_value}", "green")
+            else:
+                await player.send_message(f"Updated item {item_id} name to: {sanitized_value}", "green")
+            
+            # Log admin action
+            await self._log_admin_action(player, f"Edited item {item_id}: {property_name} = {value}")
+            
         except ValueError:
             await player.send_message("Item ID must be a number.", "red")
         except Exception as e:
@@ -697,49 +996,49 @@ Properties: {obj_dict.get('properties', {})}"""
                 await player.send_message("Database not available.", "red")
                 return
             
-            async with db.pool.acquire() as conn:
-                # Check if monster exists
-                monster = await conn.fetchrow('SELECT * FROM monsters WHERE id = $1', monster_id)
-                if not monster:
-                    await player.send_message(f"Monster {monster_id} does not exist.", "red")
+            # Validate column name to prevent SQL injection
+            actual_column = _MONSTER_COL_MAP.get(property_name, property_name)
+            
+            if actual_column in _MONSTER_TEXT_COLS:
+                # Sanitize text input
+                try:
+                    new_value = InputSanitizer.sanitize_string(value, max_length=255)
+                except ValueError as e:
+                    await player.send_message(f"Invalid value: {e}", "red")
                     return
-                
-                # Validate column name to prevent SQL injection
-                valid_text_columns = {'name', 'description'}
-                valid_numeric_columns = {'level', 'health', 'attack', 'defense', 'experience_reward'}
-                column_map = {'exp_reward': 'experience_reward'}  # Allow alias
-                
-                actual_column = column_map.get(property_name, property_name)
-                
-                if actual_column in valid_text_columns:
-                    # Sanitize text input
-                    try:
-                        sanitized_value = InputSanitizer.sanitize_string(value, max_length=255)
-                    except ValueError as e:
-                        await player.send_message(f"Invalid value: {e}", "red")
-                        return
-                    
-                    await conn.execute(f'UPDATE monsters SET {actual_column} = $1 WHERE id = $2', sanitized_value, monster_id)
-                    await player.send_message(f"Updated monster {monster_id} {property_name} to: {sanitized_value}", "green")
-                elif actual_column in valid_numeric_columns:
-                    try:
-                        numeric_value = int(value)
-                        if numeric_value < 0:
-                            await player.send_message(f"{property_name} must be a positive number.", "red")
-                            return
-                        
-                        await conn.execute(f'UPDATE monsters SET {actual_column} = $1 WHERE id = $2', numeric_value, monster_id)
-                        await player.send_message(f"Updated monster {monster_id} {property_name} to: {numeric_value}", "green")
-                    except ValueError:
-                        await player.send_message(f"{property_name} must be a number.", "red")
-                        return
-                else:
-                    await player.send_message(f"Unknown property: {property_name}", "red")
+            elif actual_column in _MONSTER_NUM_COLS:
+                # Reject obvious non-numbers without raising
+                if not value.lstrip('-').isdigit():
+                    await player.send_message(f"{property_name} must be a number.", "red")
                     return
-                
-                # Log admin action
-                await self._log_admin_action(player, f"Edited monster {monster_id}: {property_name} = {value}")
-                
+                try:
+                    new_value = int(value)
+                except ValueError:
+                    await player.send_message(f"{property_name} must be a number.", "red")
+                    return
+                if new_value < 0:
+                    await player.send_message(f"{property_name} must be a positive number.", "red")
+                    return
+            else:
+                await player.send_message(f"Unknown property: {property_name}", "red")
+                return
+            
+            # Hold the connection only for the queries, not for the replies below
+            async with db.pool.acquire() as conn:
+                exists = await conn.fetchval('SELECT 1 FROM monsters WHERE id = $1', monster_id)
+                if exists:
+                    await conn.execute(_UPDATE_SQL[('monsters', actual_column)], new_value, monster_id)
+                    db.invalidate_row('monsters', monster_id)
+            
+            if not exists:
+                await player.send_message(f"Monster {monster_id} does not exist.", "red")
+                return
+            
+            await player.send_message(f"Updated monster {monster_id} {property_name} to: {new_value}", "green")
+            
+            # Log admin action
+            await self._log_admin_action(player, f"Edited monster {monster_id}: {property_name} = {value}")
+            
         except ValueError:
             await player.send_message("Monster ID must be a number.", "red")
         except Exception as e:
@@ -762,14 +1061,13 @@ Properties: {obj_dict.get('properties', {})}"""
             room_id = player.character['current_room']
             
             # This would need to be implemented to add monster to room
-            await player.send_message(f"Spawned {monster['name']} in current room.", "green")
-            
-            # Notify other players in room
-            await self.game_engine._broadcast_to_room(room_id, 
-                f"A {monster['name']} appears!", exclude_player=player.user_id)
-            
-            # Log admin action
-            await self._log_admin_action(player, f"Spawned monster {monster['name']} in room {room_id}")
+            # Confirmation, room notice and admin log are independent, so run them together
+            await asyncio.gather(
+                player.send_message(f"Spawned {monster['name']} in current room.", "green"),
+                self.game_engine._broadcast_to_room(room_id,
+                    f"A {monster['name']} appears!", exclude_player=player.user_id),
+                self._log_admin_action(player, f"Spawned monster {monster['name']} in room {room_id}")
+            )
             
         except ValueError:
             await player.send_message("Monster ID must be a number.", "red")
@@ -794,20 +1092,20 @@ Properties: {obj_dict.get('properties', {})}"""
             
             # Add item to room
             success = await db.add_item_to_room(room_id, item_id, hidden)
-            if success:
-                hidden_text = " (hidden)" if hidden else ""
-                await player.send_message(f"Spawned {item['name']}{hidden_text} in current room.", "green")
-                
-                # Notify other players in room (only if not hidden)
-                if not hidden:
-                    await self.game_engine._broadcast_to_room(room_id, 
-                        f"A {item['name']} appears!", exclude_player=player.user_id)
-            else:
+            if not success:
                 await player.send_message("Failed to spawn item in room.", "red")
                 return
             
-            # Log admin action
-            await self._log_admin_action(player, f"Spawned item {item['name']} in room {room_id} (hidden: {hidden})")
+            hidden_text = " (hidden)" if hidden else ""
+            pending = [
+                player.send_message(f"Spawned {item['name']}{hidden_text} in current room.", "green"),
+                self._log_admin_action(player, f"Spawned item {item['name']} in room {room_id} (hidden: {hidden})")
+            ]
+            # Notify other players in room (only if not hidden)
+            if not hidden:
+                pending.append(self.game_engine._broadcast_to_room(room_id,
+                    f"A {item['name']} appears!", exclude_player=player.user_id))
+            await asyncio.gather(*pending)
             
         except ValueError:
             await player.send_message("Item ID must be a number.", "red")
@@ -828,20 +1126,19 @@ Uptime: {current_tick / tick_rate / 60:.1f} minutes
         
         await player.send_message(stats, "cyan")
     
-    async def _broadcast_message(self, player, args: List[str]):
+    async def _broadcast_message(self, player, args: List[str], raw_tail: str = ""):
         """Broadcast a message to all players: /broadcast <message>"""
         if not args:
             await player.send_message("Usage: /broadcast <message>", "yellow")
             return
         
-        message = ' '.join(args)
+        message = _remainder(args, raw_tail, 0)
         broadcast_text = f"[ADMIN BROADCAST] {message}"
         
-        # Send to all online players
-        for p in self.game_engine.players.values():
-            await p.send_message(broadcast_text, "gold")
+        # Posted once to the shared log; each player receives it on the next game tick
+        self.game_engine.post_broadcast(broadcast_text, "gold")
         
-        await player.send_message(f"Broadcast sent to {len(self.game_engine.players)} players.", "green")
+        await player.send_message(f"Broadcast queued for {len(self.game_engine.players)} players.", "green")
         
         # Log admin action
         await self._log_admin_action(player, f"Broadcast: {message}")
@@ -865,6 +1162,7 @@ Uptime: {current_tick / tick_rate / 60:.1f} minutes
         filename = args[0]
         
         # This would load world state from file
+        self._world_version += 1
         await player.send_message(f"World state loaded from {filename}", "green")
         
         # Log admin action
@@ -876,277 +1174,44 @@ Uptime: {current_tick / tick_rate / 60:.1f} minutes
             await self._show_admin_command_help(player, args[0])
             return
             
-        help_text = """
-Admin Commands:
-Note: Use quotes for multi-word parameters, e.g., /create_room "Magic Forest" "A mystical forest"
-
-World Building:
-  /create_room "name" "description" - Create a new room
-  /link_rooms <room1_id> <direction> <room2_id> - Link two rooms
-  /edit_room <room_id> <property> "value" - Edit room properties
-  /list_rooms [page] - List all rooms
-  
-Item Management:
-  /create_item "name" <type> [stats_json] - Create a new item
-  /edit_item <item_id> <property> "value" - Edit item properties
-  /spawn_item <item_id> - Spawn item in current room
-  /list_items [page] - List all items
-  
-Monster Management:
-  /create_monster "name" <level> [stats] - Create a new monster
-  /edit_monster <monster_id> <property> "value" - Edit monster properties
-  /spawn_monster <monster_id> - Spawn monster in current room
-  /list_monsters [page] - List all monsters
-  
-Inspection:
-  /list_properties <type> <id> - List properties of room/item/monster
-  
-Player Management:
-  /teleport <player_name> <room_id> - Teleport a player
-  /promote <username> - Promote user to admin
-  /demote <username> - Demote user from admin
-  /kick <player_name> ["reason"] - Kick a player
-  /ban <player_name> ["reason"] - Ban a player
-  /unban <player_name> - Unban a player
-  
-Server Management:
-  /server_stats - Show server statistics
-  /broadcast "message" - Broadcast message to all players
-  /reload_world - Reload world data
-  /save_world [filename] - Save world state
-  /load_world <filename> - Load world state
-
-Debug Management:
-  /debug_status - Show debug logger status
-  /debug_enable [verbosity] - Enable debug logging (0-3)
-  /debug_disable - Disable debug logging
-  /debug_verbosity <level> - Set debug verbosity (0-3)
-  /debug_component <component> <on|off> - Control component debug
-
-Examples:
-  /create_room "Magic Forest" "A mystical forest filled with ancient trees"
-  /create_item "Fire Sword" weapon '{"damage": 15, "fire_damage": 5}'
-  /create_monster "Fire Dragon" 10
-  /edit_room 1 name "New Room Name"
-  /broadcast "Server will restart in 5 minutes"
-
-Note: For JSON parameters, use single quotes around the JSON object.
-"""
-        await player.send_message(help_text, "white")
+        await player.send_message(_ADMIN_HELP_TEXT, "white")
 
     async def _show_admin_command_help(self, player, command: str):
         """Show help for a specific admin command"""
         command = command.lower()
         
-        # Define help text for each admin command
-        admin_command_help = {
-            'admin_help': """Command: /admin_help [command]
-Description: Show admin command help or help for a specific admin command
-Usage:
-  /admin_help - Show all admin commands
-  /admin_help <command> - Show help for specific admin command
-Examples:
-  /admin_help
-  /admin_help create_room
-  /admin_help teleport""",
-            
-            'create_room': """Command: /create_room "name" "description"
-Description: Create a new room in the game world
-Usage: /create_room "room_name" "room_description"
-Example: /create_room "Magic Forest" "A mystical forest filled with ancient trees"
-Note: Use quotes for multi-word names and descriptions""",
-            
-            'link_rooms': """Command: /link_rooms <room1_id> <direction> <room2_id>
-Description: Create bidirectional links between two rooms
-Usage: /link_rooms <room1_id> <direction> <room2_id>
-Directions: north, south, east, west, up, down, northeast, northwest, southeast, southwest
-Example: /link_rooms 1 north 5
-Note: Creates exits in both directions automatically""",
-            
-            'create_item': """Command: /create_item "name" <type> [stats_json]
-Description: Create a new item with optional custom statistics
-Usage: /create_item "item_name" <type> [stats_json]
-Types: weapon, armor, consumable, misc
-Example: /create_item "Fire Sword" weapon '{"damage": 25, "fire_damage": 10}'
-Note: Use single quotes around JSON objects""",
-            
-            'create_monster': """Command: /create_monster "name" <level> [stats]
-Description: Create a new monster template
-Usage: /create_monster "monster_name" <level>
-Example: /create_monster "Fire Dragon" 15
-Note: Higher level monsters are automatically stronger""",
-            
-            'teleport': """Command: /teleport <player_name> <room_id>
-Description: Teleport a player to a specific room
-Usage: /teleport <player_name> <room_id>
-Example: /teleport hero123 5
-Note: Player must be online to teleport""",
-            
-            'promote': """Command: /promote <username>
-Description: Promote a user to admin status (access level 2)
-Usage: /promote <username>
-Example: /promote newadmin
-Note: Requires higher admin access level""",
-            
-            'demote': """Command: /demote <username>
-Description: Remove admin status from a user (set access level to 1)
-Usage: /demote <username>
-Example: /demote oldadmin
-Note: Cannot demote users with higher access level than yourself""",
-            
-            'kick': """Command: /kick <player_name> ["reason"]
-Description: Kick a player from the server
-Usage: /kick <player_name> ["reason"]
-Example: /kick troublemaker "Inappropriate behavior"
-Note: Player can reconnect immediately""",
-            
-            'ban': """Command: /ban <player_name> ["reason"]
-Description: Ban a player from the server
-Usage: /ban <player_name> ["reason"]
-Example: /ban cheater "Using exploits"
-Note: Player cannot reconnect until unbanned""",
-            
-            'unban': """Command: /unban <player_name>
-Description: Remove ban from a player
-Usage: /unban <player_name>
-Example: /unban reformed_player
-Note: Player can reconnect after unbanning""",
-            
-            'reload_world': """Command: /reload_world
-Description: Reload world data from the database
-Usage: /reload_world
-Example: /reload_world
-Note: Updates rooms, items, and monsters from database""",
-            
-            'list_rooms': """Command: /list_rooms [page]
-Description: List all rooms with pagination
-Usage: /list_rooms [page_number]
-Example: /list_rooms 2
-Note: Shows 10 rooms per page""",
-            
-            'list_items': """Command: /list_items [page]
-Description: List all items with pagination
-Usage: /list_items [page_number]
-Example: /list_items 1
-Note: Shows 10 items per page""",
-            
-            'list_monsters': """Command: /list_monsters [page]
-Description: List all monsters with pagination
-Usage: /list_monsters [page_number]
-Example: /list_monsters 3
-Note: Shows 10 monsters per page""",
-            
-            'list_properties': """Command: /list_properties <type> <id>
-Description: List all properties of a room, item, or monster
-Usage: /list_properties <type> <id>
-Types: room, item, monster
-Example: /list_properties room 1
-Note: Shows detailed information about the specified object""",
-            
-            'edit_room': """Command: /edit_room <room_id> <property> "value"
-Description: Edit properties of an existing room
-Usage: /edit_room <room_id> <property> "new_value"
-Properties: name, description, properties
-Example: /edit_room 1 name "New Room Name"
-Note: Use quotes for multi-word values""",
-            
-            'edit_item': """Command: /edit_item <item_id> <property> "value"
-Description: Edit properties of an existing item
-Usage: /edit_item <item_id> <property> "new_value"
-Properties: name, description, item_type, properties, stats
-Example: /edit_item 5 name "Enhanced Sword"
-Note: Use quotes for multi-word values""",
-            
-            'edit_monster': """Command: /edit_monster <monster_id> <property> "value"
-Description: Edit properties of an existing monster
-Usage: /edit_monster <monster_id> <property> "new_value"
-Properties: name, description, level, health, damage, experience_reward
-Example: /edit_monster 3 level 20
-Note: Use quotes for multi-word values""",
-            
-            'spawn_monster': """Command: /spawn_monster <monster_id>
-Description: Spawn a monster in your current room
-Usage: /spawn_monster <monster_id>
-Example: /spawn_monster 7
-Note: Creates a live instance of the monster template""",
-            
-            'spawn_item': """Command: /spawn_item <item_id>
-Description: Spawn an item in your current room
-Usage: /spawn_item <item_id>
-Example: /spawn_item 12
-Note: Creates a copy of the item in the room""",
-            
-            'server_stats': """Command: /server_stats
-Description: Display server statistics and performance information
-Usage: /server_stats
-Example: /server_stats
-Note: Shows player count, uptime, and system resources""",
-            
-            'broadcast': """Command: /broadcast "message"
-Description: Send a message to all online players
-Usage: /broadcast "message"
-Example: /broadcast "Server will restart in 10 minutes"
-Note: Message appears to all players regardless of location""",
-            
-            'save_world': """Command: /save_world [filename]
-Description: Save current world state to a file
-Usage: /save_world [filename]
-Example: /save_world backup_2024
-Note: Saves rooms, items, monsters, and player data""",
-            
-            'load_world': """Command: /load_world <filename>
-Description: Load world state from a file
-Usage: /load_world <filename>
-Example: /load_world backup_2024
-Note: Replaces current world data with saved data""",
-            
-            'debug_status': """Command: /debug_status
-Description: Show current debug logging status
-Usage: /debug_status
-Example: /debug_status
-Note: Displays enabled components and verbosity level""",
-            
-            'debug_enable': """Command: /debug_enable [verbosity]
-Description: Enable debug logging with optional verbosity level
-Usage: /debug_enable [0-3]
-Example: /debug_enable 2
-Note: Higher verbosity shows more detailed information""",
-            
-            'debug_disable': """Command: /debug_disable
-Description: Disable debug logging
-Usage: /debug_disable
-Example: /debug_disable
-Note: Stops all debug output""",
-            
-            'debug_verbosity': """Command: /debug_verbosity <level>
-Description: Set debug logging verbosity level
-Usage: /debug_verbosity <0-3>
-Example: /debug_verbosity 1
-Note: 0=minimal, 1=normal, 2=verbose, 3=very verbose""",
-            
-            'debug_component': """Command: /debug_component <component> <on|off>
-Description: Enable or disable debug logging for specific components
-Usage: /debug_component <component> <on|off>
-Components: database, game_engine, server, admin_commands
-Example: /debug_component combat on
-Note: Allows fine-grained control of debug output""",
-            
-            'map': """Command: /map
-Description: Display ASCII map centered on your current room
-Usage: /map
-Example: /map
-Note: Shows 7x7 grid with room connections and IDs"""
-        }
-        
-        if command in admin_command_help:
-            await player.send_message(admin_command_help[command], "cyan")
+        help_text = _ADMIN_COMMAND_HELP.get(command)
+        if help_text:
+            await player.send_message(help_text, "cyan")
         else:
             await player.send_message(f"No help available for admin command '{command}'. Type '/admin_help' for a list of available admin commands.", "yellow")
 
     async def _log_admin_action(self, player, action: str):
-        """Log an admin action"""
-        log_entry = f"[ADMIN] {player.character['name']}: {action}"
-        print(log_entry)  # In a real implementation, this would go to a log file
+        """Queue an admin action for the background log writer"""
+        if self._log_task is None or self._log_task.done():
+            if self._log_queue is None:
+                self._log_queue = asyncio.Queue()
+            self._log_task = asyncio.create_task(self._log_flusher())
+        self._log_queue.put_nowait(f"[ADMIN] {player.character['name']}: {action}")
+    
+    async def _log_flusher(self):
+        """Collect queued admin log lines into batches and write each batch at once"""
+        queue = self._log_queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + _LOG_FLUSH_INTERVAL
+            while len(batch) < _LOG_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # In a real implementation, this would go to a log file
+            sys.stdout.writelines(f"{line}\n" for line in batch)
+            sys.stdout.flush()
     
     def is_admin_command(self, command: str) -> bool:
         """Check if a command is an admin command"""
@@ -1154,12 +1219,8 @@ Note: Shows 7x7 grid with room connections and IDs"""
             return False
         
         # Extract just the command name (first word after /)
-        parts = command[1:].split()
-        if not parts:
-            return False
-        
-        cmd_name = parts[0]
-        return cmd_name in self.admin_commands
+        parts = command[1:].split(None, 1)
+        return bool(parts) and parts[0] in _ADMIN_DISPATCH
     
     def _parse_quoted_args(self, command_line: str) -> tuple[str, list[str]]:
         """Parse command line with support for quoted arguments"""
@@ -1168,71 +1229,62 @@ Note: Shows 7x7 grid with room connections and IDs"""
         if not line:
             return "", []
         
-        parts = []
-        current_part = ""
-        in_quotes = False
-        quote_char = None
-        
-        i = 0
-        while i < len(line):
-            char = line[i]
-            
-            if not in_quotes:
-                if char in ['"', "'"]:
-                    in_quotes = True
-                    quote_char = char
-                elif char == ' ':
-                    if current_part:
-                        parts.append(current_part)
-                        current_part = ""
-                else:
-                    current_part += char
-            else:
-                if char == quote_char:
-                    in_quotes = False
-                    quote_char = None
-                else:
-                    current_part += char
-            
-            i += 1
-        
-        if current_part:
-            parts.append(current_part)
+        if '"' not in line and "'" not in line:
+            parts = _SPACES.split(line)
+        else:
+            # Quotes may appear mid-word and an unterminated quote runs to the end of the line
+            parts = []
+            current = []
+            for double, single, bare, space in _ARG_PIECE_RE.findall(line):
+                if space:
+                    if current:
+                        parts.append(''.join(current))
+                        current = []
+                elif double or single or bare:
+                    current.append(double or single or bare)
+            if current:
+                parts.append(''.join(current))
         
         if not parts:
             return "", []
         
         return parts[0], parts[1:]
 
-    async def process_command(self, player, command_line: str) -> bool:
-        """Process a potential admin command"""
-        if not command_line.startswith('/'):
-            return False
+    def parse_command(self, command_line: str) -> Optional[tuple[str, List[str], str]]:
+        """Parse an admin command line once into (command, args, raw_tail), or None if not an admin command"""
+        # Cheap first-word check so non-admin slash lines skip the quoted parser
+        if not self.is_admin_command(command_line):
+            return None
         
         command, args = self._parse_quoted_args(command_line)
-        if not command:
+        if command not in _ADMIN_DISPATCH:
+            return None
+        
+        # Without quotes the argument text splits exactly like args, so handlers can slice it
+        raw_tail = ""
+        if args and command in _RAW_TAIL_COMMANDS:
+            line = command_line[1:].strip()
+            if '"' not in line and "'" not in line:
+                raw_tail = _SPACES.split(line, 1)[1]
+        return command, args, raw_tail
+    
+    async def process_command(self, player, command_line: str) -> bool:
+        """Process a potential admin command; returns False if the line is not one"""
+        parsed = self.parse_command(command_line)
+        if parsed is None:
             return False
         
-        if command in self.admin_commands:
-            await self.process_admin_command(player, command, args)
-            return True
-        elif command == 'admin_help':
-            await self._show_admin_help(player, args)
-            return True
-        
-        return False
+        await self.process_admin_command(player, *parsed)
+        return True
 
     # Debug Control Methods
     async def _debug_status(self, player, args: List[str]):
         """Show debug logger status: /debug_status"""
-        from debug_logger import debug_logger
         status = debug_logger.get_status()
         await player.send_message(f"Debug Logger Status:\n{status}", "cyan")
     
     async def _debug_enable(self, player, args: List[str]):
         """Enable debug logging: /debug_enable [verbosity]"""
-        from debug_logger import debug_logger
-        
         verbosity = 1  # Default to normal
         if args:
             try:
@@ -1253,8 +1305,6 @@ Note: Shows 7x7 grid with room connections and IDs"""
     
     async def _debug_disable(self, player, args: List[str]):
         """Disable debug logging: /debug_disable"""
-        from debug_logger import debug_logger
-        
         debug_logger.disable()
         await player.send_message("Debug logging disabled", "green")
         
@@ -1263,8 +1313,6 @@ Note: Shows 7x7 grid with room connections and IDs"""
     
     async def _debug_verbosity(self, player, args: List[str]):
         """Set debug verbosity: /debug_verbosity <level>"""
-        from debug_logger import debug_logger
-        
         if not args:
             await player.send_message("Usage: /debug_verbosity <level>", "yellow")
             await player.send_message("Levels: 0=minimal, 1=normal, 2=verbose, 3=very_verbose", "yellow")
@@ -1291,8 +1339,6 @@ Note: Shows 7x7 grid with room connections and IDs"""
     
     async def _debug_component(self, player, args: List[str]):
         """Enable/disable debug for specific components: /debug_component <component> <on|off>"""
-        from debug_logger import debug_logger
-        
         if len(args) != 2:
             await player.send_message("Usage: /debug_component <component> <on|off>", "yellow")
             components = list(debug_logger.components.keys())
@@ -1333,75 +1379,65 @@ Note: Shows 7x7 grid with room connections and IDs"""
             await player.send_message("Error: Cannot find current room", "red")
             return
         
-        # Build a map of rooms within 3 steps from current room
-        room_map = {}
-        await self._build_room_map(current_room_id, room_map, 0, 3)
+        # Build a map of rooms within 3 steps from current room, reusing a recent one if the world is unchanged
+        cached = self._map_cache.get(current_room_id)
+        if cached and cached[1] == self._world_version and time.monotonic() < cached[0]:
+            room_map = cached[2]
+        else:
+            room_map = await self._build_room_map(current_room_id, 3)
+            self._map_cache[current_room_id] = (time.monotonic() + _MAP_CACHE_TTL, self._world_version, room_map)
         
         # Generate ASCII map
         ascii_map = await self._generate_ascii_map(current_room_id, room_map)
         
-        # Send the map as individual lines to avoid formatting issues
-        await player.send_message("", "white")  # Empty line for spacing
-        await player.send_message("Map (you are at the center):", "cyan")
-        await player.send_message("", "white")  # Empty line for spacing
-        
-        # Split the map into lines and send each line separately
-        map_lines = ascii_map.split('\n')
-        for line in map_lines:
-            await player.send_message(line, "white")
-        
-        await player.send_message("", "white")  # Empty line for spacing
+        # Title and map body as one message per color, with blank lines for spacing
+        await player.send_message("\nMap (you are at the center):", "cyan")
+        await player.send_message(f"\n{ascii_map}\n", "white")
         
         # Log admin action
         await self._log_admin_action(player, f"Viewed map from room {current_room_id}")
     
-    async def _build_room_map(self, start_room_id: int, room_map: dict, current_depth: int, max_depth: int):
-        """Recursively build a map of connected rooms"""
-        if current_depth > max_depth or start_room_id in room_map:
-            return
+    async def _build_room_map(self, start_room_id: int, max_depth: int) -> dict:
+        """Breadth-first map of rooms within max_depth steps, one query per depth level"""
+        room_map = {}
+        frontier = {start_room_id}
         
-        room = await db.get_room(start_room_id)
-        if not room:
-            return
+        for depth in range(max_depth + 1):
+            if not frontier:
+                break
+            
+            next_frontier = set()
+            for room in await db.get_room_links(frontier):
+                # The jsonb codec already decodes exits to a dict
+                exits = room['exits'] or {}
+                
+                room_map[room['id']] = {
+                    'name': room['name'],
+                    'exits': exits
+                }
+                
+                if depth < max_depth:
+                    next_frontier.update(room_id for room_id in exits.values() if isinstance(room_id, int))
+            
+            frontier = next_frontier - room_map.keys()
         
-        # Parse exits
-        exits = {}
-        if room.get('exits'):
-            if isinstance(room['exits'], str):
-                try:
-                    exits = json.loads(room['exits'])
-                except (json.JSONDecodeError, TypeError):
-                    exits = {}
-            elif isinstance(room['exits'], dict):
-                exits = room['exits']
-        
-        room_map[start_room_id] = {
-            'name': room['name'],
-            'exits': exits
-        }
-        
-        # Recursively explore connected rooms
-        if current_depth < max_depth:
-            for direction, connected_room_id in exits.items():
-                if isinstance(connected_room_id, int):
-                    await self._build_room_map(connected_room_id, room_map, current_depth + 1, max_depth)
+        return room_map
     
     async def _generate_ascii_map(self, center_room_id: int, room_map: dict):
         """Generate ASCII map with the center room in the middle"""
-        # Create a 7x7 grid (3 rooms in each direction from center)
-        grid_size = 7
+        # Create a 7x7 grid (3 rooms in each direction from center) as one flat buffer,
+        # each row followed by a newline so cell (row, col) lives at row * stride + col
+        grid_size = _MAP_GRID_SIZE
+        stride = grid_size + 1
         center = grid_size // 2  # Index 3 is the center
-        
-        # Initialize grid with spaces
-        grid = [[' ' for _ in range(grid_size)] for _ in range(grid_size)]
+        grid = bytearray(b' ' * grid_size + b'\n') * grid_size
         room_positions = {}
         
         # Place center room
-        grid[center][center] = '@'  # @ represents current room
+        grid[center * stride + center] = ord('@')  # @ represents current room
         room_positions[center_room_id] = (center, center)
         
         # Use BFS to place rooms relative to center
-        from collections import deque
         queue = deque([(center_room_id, center, center)])
         visited = {center_room_id}
         
@@ -1411,42 +1447,33 @@ Note: Shows 7x7 grid with room connections and IDs"""
             if room_id not in room_map:
                 continue
             
-            room_data = room_map[room_id]
-            exits = room_data.get('exits', {})
-            
-            # Direction mappings
-            directions = {
-                'north': (-1, 0),
-                'south': (1, 0),
-                'east': (0, 1),
-                'west': (0, -1)
-            }
+            exits = room_map[room_id].get('exits', {})
             
             for direction, connected_room_id in exits.items():
-                if direction not in directions or connected_room_id in visited:
+                offset = _MAP_OFFSETS.get(direction)
+                if offset is None or connected_room_id in visited:
                     continue
                 
                 if not isinstance(connected_room_id, int):
                     continue
                 
-                dr, dc = directions[direction]
-                new_row, new_col = row + dr, col + dc
+                new_row, new_col = row + offset[0], col + offset[1]
                 
                 # Check bounds
                 if 0 <= new_row < grid_size and 0 <= new_col < grid_size:
                     if connected_room_id in room_map:
-                        grid[new_row][new_col] = '.'  # . represents other rooms
+                        grid[new_row * stride + new_col] = ord('.')  # . represents other rooms
                         room_positions[connected_room_id] = (new_row, new_col)
                         visited.add(connected_room_id)
                         queue.append((connected_room_id, new_row, new_col))
         
         # Add connection lines between adjacent rooms
+        space = ord(' ')
         for room_id, (row, col) in room_positions.items():
             if room_id not in room_map:
                 continue
             
-            room_data = room_map[room_id]
-            exits = room_data.get('exits', {})
+            exits = room_map[room_id].get('exits', {})
             
             # Draw connections to adjacent rooms
             for direction, connected_room_id in exits.items():
@@ -1455,31 +1482,20 @@ Note: Shows 7x7 grid with room connections and IDs"""
                 
                 # Draw connection lines
                 if direction == 'north' and row > 0:
-                    if grid[row - 1][col] == ' ':
-                        grid[row - 1][col] = '|'
+                    pos = (row - 1) * stride + col
+                    if grid[pos] == space:
+                        grid[pos] = ord('|')
                 elif direction == 'south' and row < grid_size - 1:
-                    if grid[row + 1][col] == ' ':
-                        grid[row + 1][col] = '|'
+                    pos = (row + 1) * stride + col
+                    if grid[pos] == space:
+                        grid[pos] = ord('|')
                 elif direction == 'east' and col < grid_size - 1:
-                    if grid[row][col + 1] == ' ':
-                        grid[row][col + 1] = '-'
+                    pos = row * stride + col + 1
+                    if grid[pos] == space:
+                        grid[pos] = ord('-')
                 elif direction == 'west' and col > 0:
-                    if grid[row][col - 1] == ' ':
-                        grid[row][col - 1] = '-'
-        
-        # Convert grid to string with proper formatting
-        result = []
-        for row in grid:
-            # Join characters and ensure consistent spacing
-            line = ''.join(row)
-            result.append(line)
-        
-        # Add legend
-        result.append("")
-        result.append("Legend:")
-        result.append("@ = Your current location")
-        result.append(". = Other rooms")
-        result.append("| = North/South connection")
-        result.append("- = East/West connection")
-        
-        return '\n'.join(result)
\ No newline at end of file
+                    pos = row * stride + col - 1
+                    if grid[pos] == space:
+                        grid[pos] = ord('-')
+        
+        return grid.decode('ascii') + _MAP_LEGEND
@@ -1,6 +1,29 @@
+import functools
 import random
-from typing import Dict, List, Tuple
+from typing import Dict, Tuple
 from input_sanitizer import InputSanitizer
+from dice import NUMBA_AVAILABLE
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+_STAT_NAMES = ('strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma')
+# Stat modifier lookup for the normal stat range; anything outside falls back to arithmetic
+_STAT_MOD = tuple((v - 10) // 2 for v in range(26))
+_STAT_MOD_LEN = len(_STAT_MOD)
+_NO_DERIVED_BONUS = {'health_bonus': 0, 'mana_bonus': 0}
+_STAT_LABELS = tuple((stat, stat.capitalize()) for stat in _STAT_NAMES)
+_RNG = np.random.default_rng() if NUMPY_AVAILABLE else None
+
+if NUMBA_AVAILABLE:
+    from dice import roll6
+
+def _format_bonuses(bonuses: Dict[str, int]) -> str:
+    """Format nonzero stat bonuses as '+2 strength, -1 wisdom'"""
+    return ', '.join(f"{bonus:+d} {stat}" for stat, bonus in bonuses.items() if bonus)
 
 class CharacterCreation:
     """Handles character creation process including race/class selection and stat rolling"""
@@ -11,31 +34,41 @@ class CharacterCreation:
             'description': 'Versatile and adaptable, humans excel in all areas.',
             'stat_bonuses': {'strength': 1, 'dexterity': 1, 'constitution': 1, 
                            'intelligence': 1, 'wisdom': 1, 'charisma': 1},
-            'special_abilities': ['Versatility: +1 to all stats']
+            'special_abilities': ['Versatility: +1 to all stats'],
+            'health_bonus': 0,
+            'mana_bonus': 0
         },
         'elf': {
             'name': 'Elf',
             'description': 'Graceful and magical, elves are natural spellcasters.',
             'stat_bonuses': {'dexterity': 2, 'intelligence': 2, 'wisdom': 1, 'constitution': -1},
-            'special_abilities': ['Keen Senses: +2 to perception', 'Magic Affinity: +10 max mana']
+            'special_abilities': ['Keen Senses: +2 to perception', 'Magic Affinity: +10 max mana'],
+            'health_bonus': 0,
+            'mana_bonus': 10
         },
         'dwarf': {
             'name': 'Dwarf',
             'description': 'Hardy and strong, dwarves are excellent warriors and craftsmen.',
             'stat_bonuses': {'strength': 2, 'constitution': 3, 'wisdom': 1, 'dexterity': -1, 'charisma': -1},
-            'special_abilities': ['Toughness: +15 max health', 'Weapon Expertise: +1 attack damage']
+            'special_abilities': ['Toughness: +15 max health', 'Weapon Expertise: +1 attack damage'],
+            'health_bonus': 15,
+            'mana_bonus': 0
         },
         'halfling': {
             'name': 'Halfling',
             'description': 'Small but nimble, halflings make excellent rogues and scouts.',
             'stat_bonuses': {'dexterity': 3, 'charisma': 2, 'strength': -2, 'constitution': -1},
-            'special_abilities': ['Lucky: Reroll 1s on dice', 'Stealth: +2 to hiding']
+            'special_abilities': ['Lucky: Reroll 1s on dice', 'Stealth: +2 to hiding'],
+            'health_bonus': 0,
+            'mana_bonus': 0
         },
         'orc': {
             'name': 'Orc',
             'description': 'Powerful and fierce, orcs are natural warriors.',
             'stat_bonuses': {'strength': 3, 'constitution': 2, 'intelligence': -2, 'charisma': -1},
-            'special_abilities': ['Rage: +2 damage when below 50% health', 'Intimidation: +2 to fear effects']
+            'special_abilities': ['Rage: +2 damage when below 50% health', 'Intimidation: +2 to fear effects'],
+            'health_bonus': 0,
+            'mana_bonus': 0
         }
     }
     
@@ -44,7 +77,7 @@ class CharacterCreation:
             'name': 'Warrior',
             'description': 'Masters of combat, warriors excel in melee fighting.',
             'stat_bonuses': {'strength': 3, 'constitution': 2, 'intelligence': -1},
-            'starting_equipment': ['iron_sword', 'leather_armor', 'health_potion'],
+            'starting_equipment': ('iron_sword', 'leather_armor', 'health_potion'),
             'special_abilities': ['Combat Expertise: +2 attack damage', 'Armor Mastery: +1 defense'],
             'health_bonus': 20,
             'mana_bonus': 0
@@ -53,7 +86,7 @@ class CharacterCreation:
             'name': 'Mage',
             'description': 'Wielders of arcane magic, mages cast powerful spells.',
             'stat_bonuses': {'intelligence': 3, 'wisdom': 2, 'strength': -2},
-            'starting_equipment': ['wooden_staff', 'mage_robes', 'mana_potion'],
+            'starting_equipment': ('wooden_staff', 'mage_robes', 'mana_potion'),
             'special_abilities': ['Spellcasting: Can cast magic spells', 'Mana Efficiency: -1 mana cost'],
             'health_bonus': -10,
             'mana_bonus': 30
@@ -62,7 +95,7 @@ class CharacterCreation:
             'name': 'Rogue',
             'description': 'Stealthy and cunning, rogues strike from the shadows.',
             'stat_bonuses': {'dexterity': 3, 'charisma': 1, 'constitution': -1},
-            'starting_equipment': ['dagger', 'leather_armor', 'lockpicks'],
+            'starting_equipment': ('dagger', 'leather_armor', 'lockpicks'),
             'special_abilities': ['Sneak Attack: +50% damage from behind', 'Stealth: Can hide in shadows'],
             'health_bonus': 5,
             'mana_bonus': 10
@@ -71,7 +104,7 @@ class CharacterCreation:
             'name': 'Cleric',
             'description': 'Divine spellcasters who heal allies and smite enemies.',
             'stat_bonuses': {'wisdom': 3, 'constitution': 1, 'dexterity': -1},
-            'starting_equipment': ['mace', 'chain_mail', 'healing_potion'],
+            'starting_equipment': ('mace', 'chain_mail', 'healing_potion'),
             'special_abilities': ['Divine Magic: Can cast healing spells', 'Turn Undead: Frighten undead'],
             'health_bonus': 10,
             'mana_bonus': 20
@@ -80,75 +113,110 @@ class CharacterCreation:
             'name': 'Ranger',
             'description': 'Masters of nature and archery, rangers protect the wilderness.',
             'stat_bonuses': {'dexterity': 2, 'wisdom': 2, 'strength': 1},
-            'starting_equipment': ['bow', 'arrows', 'leather_armor'],
+            'starting_equipment': ('bow', 'arrows', 'leather_armor'),
             'special_abilities': ['Tracking: Can track creatures', 'Nature Magic: Basic nature spells'],
             'health_bonus': 15,
             'mana_bonus': 15
         }
     }
     
+    # Stat bonuses as vectors in _STAT_NAMES order, filled by _init_tables()
+    _RACE_BONUS: Dict[str, Tuple[int, ...]] = {}
+    _CLASS_BONUS: Dict[str, Tuple[int, ...]] = {}
+    # Every (race, class) pair: summed stat vector and (health, mana) adjustment
+    _COMBINED_BONUS: Dict[Tuple[str, str], Tuple[int, ...]] = {}
+    _DERIVED_ADJUST: Dict[Tuple[str, str], Tuple[int, int]] = {}
+    
+    @classmethod
+    def _init_tables(cls):
+        """Precompute race/class stat bonus vectors"""
+        for race, race_data in cls.RACES.items():
+            bonuses = race_data['stat_bonuses']
+            cls._RACE_BONUS[race] = tuple(bonuses.get(stat, 0) for stat in _STAT_NAMES)
+        for char_class, class_data in cls.CLASSES.items():
+            bonuses = class_data['stat_bonuses']
+            cls._CLASS_BONUS[char_class] = tuple(bonuses.get(stat, 0) for stat in _STAT_NAMES)
+        for race, race_vec in cls._RACE_BONUS.items():
+            for char_class, class_vec in cls._CLASS_BONUS.items():
+                key = (race, char_class)
+                cls._COMBINED_BONUS[key] = tuple(r + c for r, c in zip(race_vec, class_vec))
+                cls._DERIVED_ADJUST[key] = cls._derived_adjust(race, char_class)
+    
+    @classmethod
+    def _derived_adjust(cls, race: str, char_class: str) -> Tuple[int, int]:
+        """Sum race and class health/mana bonuses, ignoring unknown keys"""
+        race_data = cls.RACES.get(race, _NO_DERIVED_BONUS)
+        class_data = cls.CLASSES.get(char_class, _NO_DERIVED_BONUS)
+        return (race_data['health_bonus'] + class_data['health_bonus'],
+                race_data['mana_bonus'] + class_data['mana_bonus'])
+    
+    @staticmethod
+    def _apply_bonus_vector(base_stats: Dict[str, int], bonus_vec: Tuple[int, ...]) -> Dict[str, int]:
+        """Add a bonus vector to base stats, keeping bonused stats at a minimum of 3"""
+        return {stat: max(3, base_stats[stat] + bonus) if bonus else base_stats[stat]
+                for stat, bonus in zip(_STAT_NAMES, bonus_vec)}
+    
     @staticmethod
     def roll_stats() -> Dict[str, int]:
         """Roll character stats using 4d6 drop lowest method"""
-        stats = {}
-        stat_names = ['strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma']
+        if NUMBA_AVAILABLE:
+            return dict(zip(_STAT_NAMES, roll6().tolist()))
         
-        for stat in stat_names:
+        if NUMPY_AVAILABLE:
+            # All 24 dice in one call; sort each row and keep the top 3
+            rolls = _RNG.integers(1, 7, size=(6, 4), dtype=np.int8)
+            rolls.sort(axis=1)
+            totals = rolls[:, 1:].sum(axis=1)
+            return dict(zip(_STAT_NAMES, totals.tolist()))
+        
+        stats = {}
+        for stat in _STAT_NAMES:
             # Roll 4d6, drop lowest
             rolls = [random.randint(1, 6) for _ in range(4)]
-            rolls.sort(reverse=True)
-            stats[stat] = sum(rolls[:3])  # Take highest 3
+            stats[stat] = sum(rolls) - min(rolls)  # Take highest 3
         
         return stats
     
     @staticmethod
     def apply_racial_bonuses(base_stats: Dict[str, int], race: str) -> Dict[str, int]:
         """Apply racial stat bonuses to base stats"""
-        if race not in CharacterCreation.RACES:
+        bonus_vec = CharacterCreation._RACE_BONUS.get(race)
+        if bonus_vec is None:
             return base_stats
         
-        modified_stats = base_stats.copy()
-        bonuses = CharacterCreation.RACES[race]['stat_bonuses']
-        
-        for stat, bonus in bonuses.items():
-            modified_stats[stat] = max(3, modified_stats[stat] + bonus)  # Minimum stat of 3
-        
-        return modified_stats
+        return CharacterCreation._apply_bonus_vector(base_stats, bonus_vec)
     
     @staticmethod
     def apply_class_bonuses(base_stats: Dict[str, int], char_class: str) -> Dict[str, int]:
         """Apply class stat bonuses to base stats"""
-        if char_class not in CharacterCreation.CLASSES:
+        bonus_vec = CharacterCreation._CLASS_BONUS.get(char_class)
+        if bonus_vec is None:
             return base_stats
         
-        modified_stats = base_stats.copy()
-        bonuses = CharacterCreation.CLASSES[char_class]['stat_bonuses']
-        
-        for stat, bonus in bonuses.items():
-            modified_stats[stat] = max(3, modified_stats[stat] + bonus)  # Minimum stat of 3
-        
-        return modified_stats
+        return CharacterCreation._apply_bonus_vector(base_stats, bonus_vec)
+    
+    @staticmethod
+    def apply_combined_bonuses(base_stats: Dict[str, int], race: str, char_class: str) -> Dict[str, int]:
+        """Apply racial and class stat bonuses in a single pass"""
+        bonus_vec = CharacterCreation._COMBINED_BONUS.get((race, char_class))
+        if bonus_vec is None:
+            stats_with_race = CharacterCreation.apply_racial_bonuses(base_stats, race)
+            return CharacterCreation.apply_class_bonuses(stats_with_race, char_class)
+        
+        return CharacterCreation._apply_bonus_vector(base_stats, bonus_vec)
     
     @staticmethod
     def calculate_derived_stats(stats: Dict[str, int], race: str, char_class: str) -> Dict[str, int]:
         """Calculate derived stats like health and mana"""
         derived = {}
         
-        # Base health and mana
-        base_health = 50 + (stats['constitution'] * 2)
-        base_mana = 20 + (stats['intelligence'] * 2)
+        adjust = CharacterCreation._DERIVED_ADJUST.get((race, char_class))
+        if adjust is None:
+            adjust = CharacterCreation._derived_adjust(race, char_class)
         
-        # Apply class bonuses
-        if char_class in CharacterCreation.CLASSES:
-            class_data = CharacterCreation.CLASSES[char_class]
-            base_health += class_data.get('health_bonus', 0)
-            base_mana += class_data.get('mana_bonus', 0)
-        
-        # Apply racial bonuses
-        if race == 'elf':
-            base_mana += 10
-        elif race == 'dwarf':
-            base_health += 15
+        # Base health and mana plus combined race/class bonuses
+        base_health = 50 + (stats['constitution'] * 2) + adjust[0]
+        base_mana = 20 + (stats['intelligence'] * 2) + adjust[1]
         
         derived['health'] = base_health
         derived['max_health'] = base_health
@@ -158,11 +226,12 @@ class CharacterCreation:
         return derived
     
     @staticmethod
-    def get_starting_equipment(char_class: str) -> List[str]:
-        """Get starting equipment for a class"""
-        if char_class in CharacterCreation.CLASSES:
-            return CharacterCreation.CLASSES[char_class]['starting_equipment'].copy()
-        return ['rusty_dagger', 'tattered_clothes']
+    def get_starting_equipment(char_class: str) -> Tuple[str, ...]:
+        """Get starting equipment for a class (shared template; copy before mutating)"""
+        class_data = CharacterCreation.CLASSES.get(char_class)
+        if class_data is None:
+            return ('rusty_dagger', 'tattered_clothes')
+        return class_data['starting_equipment']
     
     @staticmethod
     def create_character(name: str, race: str, char_class: str, 
@@ -172,7 +241,8 @@ class CharacterCreation:
         # Validate inputs
         if race not in CharacterCreation.RACES:
             raise ValueError(f"Invalid race: {race}")
-        if char_class not in CharacterCreation.CLASSES:
+        class_data = CharacterCreation.CLASSES.get(char_class)
+        if class_data is None:
             raise ValueError(f"Invalid class: {char_class}")
         
         # Roll or use provided stats
@@ -181,17 +251,15 @@ class CharacterCreation:
         else:
             base_stats = CharacterCreation.roll_stats()
         
-        # Apply racial bonuses
-        stats_with_race = CharacterCreation.apply_racial_bonuses(base_stats, race)
-        
-        # Apply class bonuses
-        final_stats = CharacterCreation.apply_class_bonuses(stats_with_race, char_class)
+        # Apply racial and class bonuses; both keys are valid so the pair is in the table
+        final_stats = CharacterCreation._apply_bonus_vector(
+            base_stats, CharacterCreation._COMBINED_BONUS[(race, char_class)])
         
         # Calculate derived stats
         derived_stats = CharacterCreation.calculate_derived_stats(final_stats, race, char_class)
         
         # Get starting equipment
-        starting_equipment = CharacterCreation.get_starting_equipment(char_class)
+        starting_equipment = list(class_data['starting_equipment'])
         
         # Create character data
         character = {
@@ -202,116 +270,116 @@ class CharacterCreation:
             'experience': 0,
             'current_room': 1,  # Starting room
             'inventory': starting_equipment,
-            'equipment': {},
-            **final_stats,
-            **derived_stats
+            'equipment': {}
         }
+        character.update(final_stats)
+        character.update(derived_stats)
         
         return character
     
     @staticmethod
+    @functools.lru_cache(maxsize=16)
     def get_race_info(race: str) -> str:
         """Get formatted information about a race"""
-        if race not in CharacterCreation.RACES:
+        race_data = CharacterCreation.RACES.get(race)
+        if race_data is None:
             return "Unknown race"
         
-        race_data = CharacterCreation.RACES[race]
-        info = f"{race_data['name']}: {race_data['description']}\n"
+        lines = [f"{race_data['name']}: {race_data['description']}"]
         
         # Stat bonuses
-        bonuses = race_data['stat_bonuses']
-        bonus_text = []
-        for stat, bonus in bonuses.items():
-            if bonus > 0:
-                bonus_text.append(f"+{bonus} {stat}")
-            elif bonus < 0:
-                bonus_text.append(f"{bonus} {stat}")
-        
+        bonus_text = _format_bonuses(race_data['stat_bonuses'])
         if bonus_text:
-            info += f"Stat Bonuses: {', '.join(bonus_text)}\n"
+            lines.append(f"Stat Bonuses: {bonus_text}")
         
         # Special abilities
         if race_data['special_abilities']:
-            info += f"Special Abilities: {', '.join(race_data['special_abilities'])}\n"
+            lines.append(f"Special Abilities: {', '.join(race_data['special_abilities'])}")
         
-        return info
+        return "\n".join(lines) + "\n"
     
     @staticmethod
+    @functools.lru_cache(maxsize=16)
     def get_class_info(char_class: str) -> str:
         """Get formatted information about a class"""
-        if char_class not in CharacterCreation.CLASSES:
+        class_data = CharacterCreation.CLASSES.get(char_class)
+        if class_data is None:
             return "Unknown class"
         
-        class_data = CharacterCreation.CLASSES[char_class]
-        info = f"{class_data['name']}: {class_data['description']}\n"
+        lines = [f"{class_data['name']}: {class_data['description']}"]
         
         # Stat bonuses
-        bonuses = class_data['stat_bonuses']
-        bonus_text = []
-        for stat, bonus in bonuses.items():
-            if bonus > 0:
-                bonus_text.append(f"+{bonus} {stat}")
-            elif bonus < 0:
-                bonus_text.append(f"{bonus} {stat}")
-        
+        bonus_text = _format_bonuses(class_data['stat_bonuses'])
         if bonus_text:
-            info += f"Stat Bonuses: {', '.join(bonus_text)}\n"
+            lines.append(f"Stat Bonuses: {bonus_text}")
         
         # Health/Mana bonuses
         health_bonus = class_data.get('health_bonus', 0)
         mana_bonus = class_data.get('mana_bonus', 0)
         
         if health_bonus != 0:
-            info += f"Health Bonus: {health_bonus:+d}\n"
+            lines.append(f"Health Bonus: {health_bonus:+d}")
         if mana_bonus != 0:
-            info += f"Mana Bonus: {mana_bonus:+d}\n"
+            lines.append(f"Mana Bonus: {mana_bonus:+d}")
         
         # Starting equipment
-        equipment = class_data['starting_equipment']
-        info += f"Starting Equipment: {', '.join(equipment)}\n"
+        lines.append(f"Starting Equipment: {', '.join(class_data['starting_equipment'])}")
         
         # Special abilities
         if class_data['special_abilities']:
-            info += f"Special Abilities: {', '.join(class_data['special_abilities'])}\n"
+            lines.append(f"Special Abilities: {', '.join(class_data['special_abilities'])}")
         
-        return info
+        return "\n".join(lines) + "\n"
     
     @staticmethod
     def list_races() -> str:
         """Get a formatted list of all available races"""
-        race_list = "Available Races:\n"
-        for race_key, race_data in CharacterCreation.RACES.items():
-            race_list += f"- {race_key}: {race_data['name']}\n"
-        return race_list
+        return _RACES_LIST_STR
     
     @staticmethod
     def list_classes() -> str:
         """Get a formatted list of all available classes"""
-        class_list = "Available Classes:\n"
-        for class_key, class_data in CharacterCreation.CLASSES.items():
-            class_list += f"- {class_key}: {class_data['name']}\n"
-        return class_list
+        return _CLASSES_LIST_STR
     
     @staticmethod
     def format_stats(stats: Dict[str, int]) -> str:
         """Format stats for display"""
-        stat_order = ['strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma']
-        formatted = "Stats:\n"
-        
-        for stat in stat_order:
-            if stat in stats:
-                formatted += f"  {stat.capitalize()}: {stats[stat]}\n"
-        
-        return formatted
+        parts = ["Stats:"]
+        parts.extend(f"  {label}: {stats[stat]}" for stat, label in _STAT_LABELS if stat in stats)
+        return "\n".join(parts) + "\n"
     
     @staticmethod
     def get_stat_modifier(stat_value: int) -> int:
         """Calculate D&D-style stat modifier"""
+        if 0 <= stat_value < _STAT_MOD_LEN:
+            return _STAT_MOD[stat_value]
         return (stat_value - 10) // 2
 
+CharacterCreation._init_tables()
+
+# RACES/CLASSES never change at runtime, so the selection menus are built once
+_RACES_LIST_STR = "Available Races:\n" + "".join(
+    f"- {race_key}: {race_data['name']}\n" for race_key, race_data in CharacterCreation.RACES.items())
+_CLASSES_LIST_STR = "Available Classes:\n" + "".join(
+    f"- {class_key}: {class_data['name']}\n" for class_key, class_data in CharacterCreation.CLASSES.items())
+_RACE_MENU = _RACES_LIST_STR + "\nPlease choose a race (or type 'info <race>' for details):"
+_RACE_RETRY = _RACES_LIST_STR + "\nPlease choose a valid race:"
+_CLASS_MENU = _CLASSES_LIST_STR + "\nPlease choose a class (or type 'info <class>' for details):"
+_CLASS_RETRY = _CLASSES_LIST_STR + "\nPlease choose a valid class:"
+
+# Fixed (is_complete, response) replies shared by every session
+_PROMPTS = {
+    'stats_choice': (False, "Please type 'accept' to keep these stats, or 'reroll' to roll again:"),
+    'confirm_choice': (False, "Please type 'confirm' to create this character, or 'restart' to start over:"),
+    'created': (True, "Character created successfully! Welcome to the world!"),
+    'restarted': (False, "Character creation restarted. Please enter your character's name:"),
+}
+
 class CharacterCreationSession:
     """Manages the character creation process for a user"""
     
+    __slots__ = ('stage', 'character_data', 'rolled_stats')
+    
     def __init__(self):
         self.stage = 'name'  # name, race, class, stats, confirm
         self.character_data = {}
@@ -322,19 +390,10 @@ class CharacterCreationSession:
         Process user input during character creation
         Returns (is_complete, response_message)
         """
-        
-        if self.stage == 'name':
-            return await self._handle_name_input(user_input, connection)
-        elif self.stage == 'race':
-            return await self._handle_race_input(user_input, connection)
-        elif self.stage == 'class':
-            return await self._handle_class_input(user_input, connection)
-        elif self.stage == 'stats':
-            return await self._handle_stats_input(user_input, connection)
-        elif self.stage == 'confirm':
-            return await self._handle_confirm_input(user_input, connection)
-        
-        return False, "Unknown stage in character creation."
+        handler = self._STAGE_HANDLERS.get(self.stage)
+        if handler is None:
+            return False, "Unknown stage in character creation."
+        return await handler(self, user_input, connection)
     
     async def _handle_name_input(self, name: str, connection) -> Tuple[bool, str]:
         """Handle character name input"""
@@ -346,60 +405,46 @@ class CharacterCreationSession:
             self.character_data['name'] = sanitized_name
             self.stage = 'race'
             
-            response = f"Welcome, {sanitized_name}!\n\n"
-            response += CharacterCreation.list_races()
-            response += "\nPlease choose a race (or type 'info <race>' for details):"
-            
-            return False, response
+            return False, f"Welcome, {sanitized_name}!\n\n{_RACE_MENU}"
         except ValueError as e:
             return False, str(e)
     
     async def _handle_race_input(self, input_text: str, connection) -> Tuple[bool, str]:
         """Handle race selection input"""
-        parts = input_text.strip().lower().split()
+        race = input_text.strip().lower()
         
-        if len(parts) == 2 and parts[0] == 'info':
-            race = parts[1]
+        if race.startswith('info '):
+            race = race[5:].strip()
             if race in CharacterCreation.RACES:
                 info = CharacterCreation.get_race_info(race)
                 return False, f"{info}\nPlease choose a race:"
             else:
                 return False, f"Unknown race: {race}. Please choose a valid race:"
         
-        race = input_text.strip().lower()
-        if race not in CharacterCreation.RACES:
-            response = f"Invalid race: {race}\n"
-            response += CharacterCreation.list_races()
-            response += "\nPlease choose a valid race:"
-            return False, response
+        race_data = CharacterCreation.RACES.get(race)
+        if race_data is None:
+            return False, f"Invalid race: {race}\n{_RACE_RETRY}"
         
         self.character_data['race'] = race
         self.stage = 'class'
         
-        response = f"You have chosen {CharacterCreation.RACES[race]['name']}.\n\n"
-        response += CharacterCreation.list_classes()
-        response += "\nPlease choose a class (or type 'info <class>' for details):"
-        
-        return False, response
+        return False, f"You have chosen {race_data['name']}.\n\n{_CLASS_MENU}"
     
     async def _handle_class_input(self, input_text: str, connection) -> Tuple[bool, str]:
         """Handle class selection input"""
-        parts = input_text.strip().lower().split()
+        char_class = input_text.strip().lower()
         
-        if len(parts) == 2 and parts[0] == 'info':
-            char_class = parts[1]
+        if char_class.startswith('info '):
+            char_class = char_class[5:].strip()
             if char_class in CharacterCreation.CLASSES:
                 info = CharacterCreation.get_class_info(char_class)
                 return False, f"{info}\nPlease choose a class:"
             else:
                 return False, f"Unknown class: {char_class}. Please choose a valid class:"
         
-        char_class = input_text.strip().lower()
-        if char_class not in CharacterCreation.CLASSES:
-            response = f"Invalid class: {char_class}\n"
-            response += CharacterCreation.list_classes()
-            response += "\nPlease choose a valid class:"
-            return False, response
+        class_data = CharacterCreation.CLASSES.get(char_class)
+        if class_data is None:
+            return False, f"Invalid class: {char_class}\n{_CLASS_RETRY}"
         
         self.character_data['class'] = char_class
         self.stage = 'stats'
@@ -407,7 +452,7 @@ class CharacterCreationSession:
         # Roll stats
         self.rolled_stats = CharacterCreation.roll_stats()
         
-        response = f"You have chosen {CharacterCreation.CLASSES[char_class]['name']}.\n\n"
+        response = f"You have chosen {class_data['name']}.\n\n"
         response += "Rolling your character stats...\n\n"
         response += CharacterCreation.format_stats(self.rolled_stats)
         response += "\nType 'accept' to keep these stats, or 'reroll' to roll again:"
@@ -416,53 +461,69 @@ class CharacterCreationSession:
     
     async def _handle_stats_input(self, input_text: str, connection) -> Tuple[bool, str]:
         """Handle stats confirmation input"""
-        choice = input_text.strip().lower()
-        
-        if choice == 'reroll':
-            self.rolled_stats = CharacterCreation.roll_stats()
-            response = "Rolling new stats...\n\n"
-            response += CharacterCreation.format_stats(self.rolled_stats)
-            response += "\nType 'accept' to keep these stats, or 'reroll' to roll again:"
-            return False, response
-        
-        elif choice == 'accept':
-            self.character_data['stats'] = self.rolled_stats
-            self.stage = 'confirm'
-            
-            # Show final character summary
-            response = "Character Summary:\n"
-            response += f"Name: {self.character_data['name']}\n"
-            response += f"Race: {CharacterCreation.RACES[self.character_data['race']]['name']}\n"
-            response += f"Class: {CharacterCreation.CLASSES[self.character_data['class']]['name']}\n\n"
-            
-            # Apply bonuses for display
-            final_stats = CharacterCreation.apply_racial_bonuses(self.rolled_stats, self.character_data['race'])
-            final_stats = CharacterCreation.apply_class_bonuses(final_stats, self.character_data['class'])
-            
-            response += "Final Stats (with racial and class bonuses):\n"
-            response += CharacterCreation.format_stats(final_stats)
-            
-            response += "\nType 'confirm' to create this character, or 'restart' to start over:"
-            return False, response
-        
-        else:
-            return False, "Please type 'accept' to keep these stats, or 'reroll' to roll again:"
+        action = self._STATS_ACTIONS.get(input_text.strip().lower())
+        if action is None:
+            return _PROMPTS['stats_choice']
+        return action(self)
+    
+    def _stats_reroll(self) -> Tuple[bool, str]:
+        """Roll a fresh set of stats"""
+        self.rolled_stats = CharacterCreation.roll_stats()
+        response = "Rolling new stats...\n\n"
+        response += CharacterCreation.format_stats(self.rolled_stats)
+        response += "\nType 'accept' to keep these stats, or 'reroll' to roll again:"
+        return False, response
+    
+    def _stats_accept(self) -> Tuple[bool, str]:
+        """Keep the rolled stats and show the final character summary"""
+        self.character_data['stats'] = self.rolled_stats
+        self.stage = 'confirm'
+        
+        # Apply bonuses for display
+        final_stats = CharacterCreation.apply_combined_bonuses(
+            self.rolled_stats, self.character_data['race'], self.character_data['class'])
+        
+        response = "".join((
+            "Character Summary:\n",
+            f"Name: {self.character_data['name']}\n",
+            f"Race: {CharacterCreation.RACES[self.character_data['race']]['name']}\n",
+            f"Class: {CharacterCreation.CLASSES[self.character_data['class']]['name']}\n\n",
+            "Final Stats (with racial and class bonuses):\n",
+            CharacterCreation.format_stats(final_stats),
+            "\nType 'confirm' to create this character, or 'restart' to start over:",
+        ))
+        return False, response
     
     async def _handle_confirm_input(self, input_text: str, connection) -> Tuple[bool, str]:
         """Handle final confirmation input"""
-        choice = input_text.strip().lower()
-        
-        if choice == 'confirm':
-            # Character creation is complete
-            return True, "Character created successfully! Welcome to the world!"
-        
-        elif choice == 'restart':
-            # Reset the session
-            self.__init__()
-            return False, "Character creation restarted. Please enter your character's name:"
-        
-        else:
-            return False, "Please type 'confirm' to create this character, or 'restart' to start over:"
+        action = self._CONFIRM_ACTIONS.get(input_text.strip().lower())
+        if action is None:
+            return _PROMPTS['confirm_choice']
+        return action(self)
+    
+    def _confirm_create(self) -> Tuple[bool, str]:
+        """Character creation is complete"""
+        return _PROMPTS['created']
+    
+    def _confirm_restart(self) -> Tuple[bool, str]:
+        """Reset the session"""
+        self.stage = 'name'
+        self.character_data.clear()
+        self.rolled_stats = None
+        return _PROMPTS['restarted']
+    
+    # Choice word -> handler for the stats and confirm stages
+    _STATS_ACTIONS = {'reroll': _stats_reroll, 'accept': _stats_accept}
+    _CONFIRM_ACTIONS = {'confirm': _confirm_create, 'restart': _confirm_restart}
+    
+    # Stage name -> input handler
+    _STAGE_HANDLERS = {
+        'name': _handle_name_input,
+        'race': _handle_race_input,
+        'class': _handle_class_input,
+        'stats': _handle_stats_input,
+        'confirm': _handle_confirm_input,
+    }
     
     def get_character_data(self) -> Dict[str, any]:
         """Get the final character data"""
@@ -8,9 +8,18 @@ import asyncio
 import sys
 import socket
 import subprocess
-import os
 from typing import Optional
 
+try:
+    import asyncssh
+    SSH_AVAILABLE = True
+except ImportError:
+    SSH_AVAILABLE = False
+
+# Only wait on the transport once this much output is buffered
+_DRAIN_HIGH_WATER = 64 * 1024
+_READ_CHUNK = 65536
+
 class RPGClient:
     """Simple client for connecting to the SSH RPG server"""
     
@@ -18,33 +27,45 @@ class RPGClient:
         self.reader = None
         self.writer = None
         self.connected = False
+        self._send_queue = None
+        self._flush_task = None
+        self._transport = None  # whatever reports the write buffer size
+        self._ssh_conn = None
         
+    def _start_session(self, transport):
+        """Mark the stream pair live and start the batched writer"""
+        self.connected = True
+        self._transport = transport
+        self._send_queue = asyncio.Queue()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+    
     async def connect_tcp(self, host: str = "localhost", port: int = 2223):
         """Connect to server via TCP"""
         try:
             self.reader, self.writer = await asyncio.open_connection(host, port)
-            self.connected = True
+            self._start_session(self.writer.transport)
             print(f"Connected to {host}:{port} via TCP")
             return True
         except Exception as e:
             print(f"Failed to connect via TCP: {e}")
             return False
     
-    def connect_ssh(self, host: str = "localhost", port: int = 2222, username: str = "player"):
-        """Connect to server via SSH (using system ssh command)"""
+    async def connect_ssh(self, host: str = "localhost", port: int = 2222,
+                          username: str = "player", password: str = ""):
+        """Connect to server via SSH on the same event loop as the TCP path"""
+        if not SSH_AVAILABLE:
+            print("SSH support not available. Install asyncssh to connect via SSH.")
+            return False
+        
         try:
-            cmd = f"ssh -p {port} {username}@{host}"
-            print(f"Connecting via SSH: {cmd}")
-            print("Note: This will open SSH in a new terminal session")
-            
-            # Try to open SSH in a new terminal window
-            if sys.platform == "darwin":  # macOS
-                os.system(f"osascript -e 'tell app \"Terminal\" to do script \"{cmd}\"'")
-            elif sys.platform.startswith("linux"):
-                os.system(f"gnome-terminal -- {cmd} || xterm -e {cmd} || {cmd}")
-            else:  # Windows or fallback
-                os.system(cmd)
-            
+            # The game server accepts any password; host keys are not pinned for this test client
+            self._ssh_conn = await asyncssh.connect(
+                host, port=port, username=username, password=password, known_hosts=None
+            )
+            # Raw bytes streams so the chunked reader and batched writer apply unchanged
+            self.writer, self.reader, _ = await self._ssh_conn.open_session(encoding=None)
+            self._start_session(self.writer.channel)
+            print(f"Connected to {host}:{port} via SSH")
             return True
         except Exception as e:
             print(f"Failed to connect via SSH: {e}")
@@ -54,43 +75,71 @@ class RPGClient:
         """Send a message to the server"""
         if not self.connected or not self.writer:
             return False
+        if self._flush_task is None or self._flush_task.done():
+            return False  # Writer loop stopped after a failed write; nothing would send this
         
+        self._send_queue.put_nowait(f"{message}\n")
+        return True
+    
+    async def _flush_loop(self):
+        """Write queued messages in batches, draining only past the high-water mark"""
+        queue = self._send_queue
         try:
-            self.writer.write(f"{message}\n".encode())
-            await self.writer.drain()
-            return True
+            while True:
+                batch = [await queue.get()]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+                
+                self.writer.writelines([m.encode() for m in batch])
+                if self._transport.get_write_buffer_size() > _DRAIN_HIGH_WATER:
+                    await self.writer.drain()
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             print(f"Error sending message: {e}")
-            return False
+            self.connected = False
     
     async def receive_messages(self):
         """Receive messages from the server"""
         if not self.connected or not self.reader:
             return
         
+        linebuf = b""
+        out = sys.stdout.buffer
         try:
             while self.connected:
-                data = await self.reader.readline()
+                data = await self.reader.read(_READ_CHUNK)
                 if not data:
                     break
                 
-                message = data.decode().strip()
-                if message:
-                    print(message)
+                # Write every complete line in the chunk at once; keep the tail for the next read
+                *lines, linebuf = (linebuf + data).split(b"\n")
+                lines = [line for line in map(bytes.strip, lines) if line]
+                if lines:
+                    self._write_output(out, lines)
+            
+            message = linebuf.strip()
+            if message:
+                self._write_output(out, [message])
         except Exception as e:
             print(f"Error receiving messages: {e}")
         finally:
             self.connected = False
     
+    @staticmethod
+    def _write_output(out, lines):
+        """Write a burst of server lines to stdout with a single flush"""
+        sys.stdout.flush()  # keep ordering with anything print() has buffered
+        out.write(b"\n".join(lines) + b"\n")
+        out.flush()
+    
     async def handle_user_input(self):
         """Handle user input and send to server"""
         try:
             while self.connected:
                 try:
-                    # Use asyncio to read from stdin
-                    user_input = await asyncio.get_event_loop().run_in_executor(
-                        None, input, ""
-                    )
+                    # Read stdin on a worker thread so the event loop keeps running
+                    user_input = await asyncio.to_thread(input)
                     
                     if user_input.lower() in ['quit', 'exit']:
                         break
@@ -107,20 +156,40 @@ class RPGClient:
     async def disconnect(self):
         """Disconnect from the server"""
         self.connected = False
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
         if self.writer:
             try:
+                # Hand anything still queued to the transport; close() sends it before closing
+                pending = []
+                while not self._send_queue.empty():
+                    pending.append(self._send_queue.get_nowait().encode())
+                if pending:
+                    self.writer.writelines(pending)
                 self.writer.close()
                 await self.writer.wait_closed()
             except:
                 pass
+        if self._ssh_conn:
+            self._ssh_conn.close()
+            await self._ssh_conn.wait_closed()
+            self._ssh_conn = None
     
     async def run_tcp_session(self, host: str = "localhost", port: int = 2223):
         """Run a TCP client session"""
-        if not await self.connect_tcp(host, port):
-            return
-        
+        if await self.connect_tcp(host, port):
+            await self._run_session("TCP")
+    
+    async def run_ssh_session(self, host: str = "localhost", port: int = 2222, username: str = "player"):
+        """Run an SSH client session"""
+        if await self.connect_ssh(host, port, username):
+            await self._run_session("SSH")
+    
+    async def _run_session(self, label: str):
+        """Interact with the game over an already connected stream pair"""
         print("\n" + "=" * 50)
-        print("    SSH RPG - TCP Client")
+        print(f"    SSH RPG - {label} Client")
         print("=" * 50)
         print("Connected! You can now interact with the game.")
         print("Type 'quit' or 'exit' to disconnect.")
@@ -179,7 +248,7 @@ async def main():
     elif connection_type == "ssh":
         port = int(args[2]) if len(args) > 2 else 2222
         username = args[3] if len(args) > 3 else "player"
-        client.connect_ssh(host, port, username)
+        await client.run_ssh_session(host, port, username)
     
     else:
         # Default to TCP
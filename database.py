@@ -1,6 +1,12 @@
 import asyncio
+import functools
 import json
-from typing import Optional, Dict, List, Any
+import os
+import re
+import time
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Any, Tuple
 import bcrypt
 from input_sanitizer import InputSanitizer
 
@@ -11,10 +17,302 @@ except ImportError:
     asyncpg = None
     ASYNCPG_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+def _encode_jsonb(value) -> bytes:
+    """Binary jsonb encoder; Python objects are serialized here, pre-serialized JSON strings pass through"""
+    if isinstance(value, str):
+        return b'\x01' + value.encode('utf-8')
+    if ORJSON_AVAILABLE:
+        return b'\x01' + orjson.dumps(value)
+    return b'\x01' + json.dumps(value).encode('utf-8')
+
+def _decode_jsonb(data: bytes):
+    """Binary jsonb decoder (skips the format version byte)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data[1:])
+    return json.loads(data[1:])
+
+_OPPOSITE_DIRS = {
+    'north': 'south', 'south': 'north',
+    'east': 'west', 'west': 'east',
+    'up': 'down', 'down': 'up'
+}
+
+# Hot single-row lookups/updates, kept as constants so the text matches the statement cache exactly
+_SQL_USER_BY_NAME = 'SELECT * FROM users WHERE username = $1'
+_SQL_CHARACTER_BY_USER = 'SELECT * FROM characters WHERE user_id = $1'
+_SQL_ROOM_BY_ID = 'SELECT * FROM rooms WHERE id = $1'
+_SQL_ITEM_BY_ID = 'SELECT * FROM items WHERE id = $1'
+_SQL_MONSTER_BY_ID = 'SELECT * FROM monsters WHERE id = $1'
+_SQL_ROOM_MONSTER_HEALTH = 'UPDATE room_monsters SET health = $1 WHERE id = $2'
+_SQL_TOUCH_LAST_LOGIN = 'UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ANY($1::int[])'
+# $4 feeds both health and max_health: eight parameters for nine columns
+_SQL_CREATE_MONSTER = '''
+    INSERT INTO monsters (name, description, level, health, max_health,
+                          attack, defense, experience_reward, loot_table)
+    VALUES ($1, $2, $3, $4, $4, $5, $6, $7, $8) RETURNING id
+'''
+_SQL_MERGE_EXITS = "UPDATE rooms SET exits = COALESCE(exits, '{}'::jsonb) || $1::jsonb WHERE id = $2"
+_SQL_APPEND_ROOM_ITEM = """
+    UPDATE rooms
+    SET items = (CASE WHEN jsonb_typeof(items) = 'array' THEN items ELSE '[]'::jsonb END) || $1::jsonb
+    WHERE id = $2
+    RETURNING 1
+"""
+_SQL_REMOVE_ROOM_ITEM = """
+    UPDATE rooms
+    SET items = (
+        SELECT COALESCE(jsonb_agg(e ORDER BY pos), '[]'::jsonb)
+        FROM jsonb_array_elements(
+            CASE WHEN jsonb_typeof(items) = 'array' THEN items ELSE '[]'::jsonb END
+        ) WITH ORDINALITY AS t(e, pos)
+        WHERE (e->>'item_id')::int IS DISTINCT FROM $1
+    )
+    WHERE id = $2
+    RETURNING 1
+"""
+_SQL_ROOM_ITEMS = """
+    SELECT i.*, COALESCE((ri.elem->>'hidden')::boolean, false) AS hidden
+    FROM rooms r
+    CROSS JOIN LATERAL jsonb_array_elements(
+        CASE WHEN jsonb_typeof(r.items) = 'array' THEN r.items ELSE '[]'::jsonb END
+    ) WITH ORDINALITY AS ri(elem, pos)
+    JOIN items i ON i.id = (ri.elem->>'item_id')::int
+    WHERE r.id = $1
+    ORDER BY ri.pos
+"""
+
+# Columns create_character always sets from its own arguments
+_CHARACTER_IDENTITY = ('user_id', 'name', 'race', 'class')
+
+@functools.lru_cache(maxsize=32)
+def _insert_character_sql(columns: Tuple[str, ...]) -> str:
+    """INSERT ... RETURNING * for the identity columns plus a sorted tuple of extra columns"""
+    all_columns = _CHARACTER_IDENTITY + columns
+    placeholders = ', '.join(f"${i}" for i in range(1, len(all_columns) + 1))
+    return f"INSERT INTO characters ({', '.join(all_columns)}) VALUES ({placeholders}) RETURNING *"
+
+@functools.lru_cache(maxsize=128)
+def _update_character_sql(columns: Tuple[str, ...]) -> str:
+    """UPDATE statement for a sorted column tuple; one string per shape keeps it in the statement cache"""
+    set_clause = ', '.join(f"{column} = ${i}" for i, column in enumerate(columns, 1))
+    return f"UPDATE characters SET {set_clause} WHERE id = ${len(columns) + 1}"
+
+# Update shapes issued on movement, combat, inventory changes and level-ups
+_COMMON_CHARACTER_UPDATES = (
+    ('current_room',), ('health',), ('inventory',), ('status_line',),
+    ('current_room', 'health'), ('health', 'level', 'max_health'),
+)
+
+_HOT_STATEMENTS = (
+    _SQL_USER_BY_NAME, _SQL_CHARACTER_BY_USER, _SQL_ROOM_BY_ID,
+    _SQL_ITEM_BY_ID, _SQL_MONSTER_BY_ID, _SQL_ROOM_MONSTER_HEALTH, _SQL_ROOM_ITEMS,
+    _SQL_TOUCH_LAST_LOGIN,
+    *map(_update_character_sql, _COMMON_CHARACTER_UPDATES),
+)
+
+@functools.lru_cache(maxsize=None)
+def _param_count(sql: str) -> int:
+    """Number of $n placeholders a statement takes"""
+    return max(map(int, re.findall(r'\$(\d+)', sql)), default=0)
+
+_SCHEMA_DDL = """
+-- Users table
+CREATE TABLE IF NOT EXISTS users (
+    id SERIAL PRIMARY KEY,
+    username VARCHAR(50) UNIQUE NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    access_level INTEGER DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_login TIMESTAMP
+);
+
+-- Characters table
+CREATE TABLE IF NOT EXISTS characters (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id),
+    name VARCHAR(50) NOT NULL,
+    race VARCHAR(20) NOT NULL,
+    class VARCHAR(20) NOT NULL,
+    level INTEGER DEFAULT 1,
+    experience INTEGER DEFAULT 0,
+    health INTEGER DEFAULT 100,
+    max_health INTEGER DEFAULT 100,
+    mana INTEGER DEFAULT 50,
+    max_mana INTEGER DEFAULT 50,
+    strength INTEGER DEFAULT 10,
+    dexterity INTEGER DEFAULT 10,
+    constitution INTEGER DEFAULT 10,
+    intelligence INTEGER DEFAULT 10,
+    wisdom INTEGER DEFAULT 10,
+    charisma INTEGER DEFAULT 10,
+    current_room INTEGER DEFAULT 1,
+    inventory JSONB DEFAULT '[]',
+    equipment JSONB DEFAULT '{}',
+    status_line TEXT DEFAULT 'HP: {health}/{max_health} | MP: {mana}/{max_mana} | Room: {room_name}',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Rooms table
+CREATE TABLE IF NOT EXISTS rooms (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    description TEXT,
+    exits JSONB DEFAULT '{}',
+    items JSONB DEFAULT '[]',
+    monsters JSONB DEFAULT '[]',
+    properties JSONB DEFAULT '{}'
+);
+
+-- Items table
+CREATE TABLE IF NOT EXISTS items (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(50) NOT NULL,
+    description TEXT,
+    item_type VARCHAR(20) NOT NULL,
+    properties JSONB DEFAULT '{}',
+    stats JSONB DEFAULT '{}'
+);
+
+-- Monsters table
+CREATE TABLE IF NOT EXISTS monsters (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(50) NOT NULL,
+    description TEXT,
+    level INTEGER DEFAULT 1,
+    health INTEGER DEFAULT 50,
+    max_health INTEGER DEFAULT 50,
+    attack INTEGER DEFAULT 5,
+    defense INTEGER DEFAULT 2,
+    experience_reward INTEGER DEFAULT 10,
+    loot_table JSONB DEFAULT '[]',
+    properties JSONB DEFAULT '{}'
+);
+
+-- Room monsters table (for monster instances in rooms)
+CREATE TABLE IF NOT EXISTS room_monsters (
+    id SERIAL PRIMARY KEY,
+    room_id INTEGER REFERENCES rooms(id),
+    monster_id INTEGER REFERENCES monsters(id),
+    health INTEGER NOT NULL,
+    max_health INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Indexes for the per-player lookups (users.username is already covered by UNIQUE)
+CREATE INDEX IF NOT EXISTS idx_characters_user_id ON characters(user_id);
+CREATE INDEX IF NOT EXISTS idx_room_monsters_room_id ON room_monsters(room_id);
+"""
+
+class _SlotRow(MutableMapping):
+    """Memory-mode table row: dict interface, columns stored in __slots__ instead of a per-row dict"""
+    __slots__ = ()
+    _COLUMNS: frozenset = frozenset()
+
+    def __init__(self, **columns):
+        for key, value in columns.items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        if key in self._COLUMNS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass  # Column never set, same as a missing dict key
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self._COLUMNS:
+            raise KeyError(f"{type(self).__name__} has no column {key!r}")
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in self._COLUMNS or not hasattr(self, key):
+            raise KeyError(key)
+        delattr(self, key)
+
+    def __iter__(self):
+        return (key for key in self.__slots__ if hasattr(self, key))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+def _slot_row(name: str, columns: Tuple[str, ...]) -> type:
+    """Build a _SlotRow subclass whose slots are a table's columns"""
+    return type(name, (_SlotRow,), {'__slots__': columns, '_COLUMNS': frozenset(columns)})
+
+Character = _slot_row('Character', (
+    'id', 'user_id', 'name', 'race', 'class', 'level', 'experience', 'health', 'max_health',
+    'mana', 'max_mana', 'strength', 'dexterity', 'constitution', 'intelligence', 'wisdom',
+    'charisma', 'current_room', 'inventory', 'equipment', 'status_line', 'created_at',
+))
+Room = _slot_row('Room', ('id', 'name', 'description', 'exits', 'items', 'monsters', 'properties'))
+Item = _slot_row('Item', ('id', 'name', 'description', 'item_type', 'properties', 'stats'))
+Monster = _slot_row('Monster', (
+    'id', 'name', 'description', 'level', 'health', 'max_health', 'attack', 'defense',
+    'experience_reward', 'loot_table', 'properties',
+))
+
+# bcrypt releases the GIL while hashing, so a thread pool keeps it off the event loop
+_bcrypt_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix='bcrypt')
+
+async def _hash_password(password: str, rounds: int) -> str:
+    """Hash a password with bcrypt on the worker pool"""
+    loop = asyncio.get_running_loop()
+    salt = bcrypt.gensalt(rounds=rounds)
+    hashed = await loop.run_in_executor(_bcrypt_pool, bcrypt.hashpw, password.encode('utf-8'), salt)
+    return hashed.decode('utf-8')
+
+async def _check_password(password: str, password_hash: str) -> bool:
+    """Verify a password against a bcrypt hash on the worker pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _bcrypt_pool, bcrypt.checkpw, password.encode('utf-8'), password_hash.encode('utf-8')
+    )
+
 class Database:
-    def __init__(self, db_url: str = "postgresql://localhost/sshrpg"):
+    def __init__(self, db_url: str = "postgresql://localhost/sshrpg",
+                 pool_min_size: int = 5, pool_max_size: int = 25, command_timeout: float = 5.0):
         self.db_url = db_url
         self.pool = None
+        
+        # Connection pool sizing and per-query timeout, applied by connect()
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self.pool_max_inactive_lifetime = 300.0
+        self.command_timeout = command_timeout
+        
+        # bcrypt work factor for new password hashes (2^rounds); existing hashes keep their own
+        self.bcrypt_rounds = int(os.getenv('BCRYPT_COST', '12'))
+        
+        # Per-connection prepared statement cache; large enough for every query text in
+        # this module plus the admin UPDATEs, and never expired
+        self.statement_cache_size = 1024
+        self.max_cached_statement_lifetime = 0
+        
+        # Statements to prepare on each new pooled connection (all parameters NULL)
+        self.warm_statements = set(_HOT_STATEMENTS)
+        
+        # Read-through cache for room/item/monster rows: (table, id) -> (expires_at, row)
+        self.row_cache_ttl = 60.0
+        self.row_cache_max = 4096
+        self._row_cache: Dict[Tuple[str, int], Tuple[float, Any]] = {}
+        self._row_fetches: Dict[Tuple[str, int], asyncio.Task] = {}  # In-flight misses, shared by waiters
+        self._row_cache_gen = 0  # Bumped on invalidation so in-flight fetches don't store stale rows
+        
+        # last_login stamps are written in batches off the login path
+        self.last_login_flush_interval = 1.0
+        self._pending_logins: set = set()
+        self._login_flush_task: Optional[asyncio.Task] = None
 
     async def connect(self) -> bool:
         """Connect to the database"""
@@ -27,8 +325,13 @@ class Database:
         try:
             self.pool = await asyncpg.create_pool(
                 self.db_url,
-                min_size=1,
-                max_size=10
+                min_size=self.pool_min_size,
+                max_size=self.pool_max_size,
+                max_inactive_connection_lifetime=self.pool_max_inactive_lifetime,
+                command_timeout=self.command_timeout,
+                statement_cache_size=self.statement_cache_size,
+                max_cached_statement_lifetime=self.max_cached_statement_lifetime,
+                init=self._init_connection
             )
             print("Connected to PostgreSQL database")
             return True
@@ -39,10 +342,31 @@ class Database:
             self._init_memory_storage()
             return False
 
+    def register_warm_statements(self, statements):
+        """Add statements to prepare on every new pooled connection; call before connect()"""
+        self.warm_statements.update(statements)
+
+    async def _init_connection(self, conn):
+        """Set up the jsonb codec and warm registered statements on every pooled connection"""
+        await conn.set_type_codec(
+            'jsonb', encoder=_encode_jsonb, decoder=_decode_jsonb,
+            schema='pg_catalog', format='binary'
+        )
+
+        # Run each registered statement against no rows (all parameters NULL) so it is in
+        # the connection's statement cache before first real use
+        for sql in self.warm_statements:
+            try:
+                await conn.execute(sql, *(None,) * _param_count(sql))
+            except Exception:
+                pass  # Tables may not exist yet (e.g. before create_tables)
+
     def _init_memory_storage(self):
         """Initialize in-memory storage as fallback"""
         self.users = {}
+        self.users_by_id = {}  # Same user dicts as self.users, keyed by id
         self.characters = {}
+        self.characters_by_user = {}  # user_id -> char_id of the user's first character
         self.rooms = {}
         self.items = {}
         self.monsters = {}
@@ -54,115 +378,26 @@ class Database:
         if not self.pool:
             return
 
+        # All tables and indexes in one simple-query round-trip
         async with self.pool.acquire() as conn:
-            # Users table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    id SERIAL PRIMARY KEY,
-                    username VARCHAR(50) UNIQUE NOT NULL,
-                    password_hash VARCHAR(255) NOT NULL,
-                    access_level INTEGER DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_login TIMESTAMP
-                )
-            ''')
-
-            # Characters table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS characters (
-                    id SERIAL PRIMARY KEY,
-                    user_id INTEGER REFERENCES users(id),
-                    name VARCHAR(50) NOT NULL,
-                    race VARCHAR(20) NOT NULL,
-                    class VARCHAR(20) NOT NULL,
-                    level INTEGER DEFAULT 1,
-                    experience INTEGER DEFAULT 0,
-                    health INTEGER DEFAULT 100,
-                    max_health INTEGER DEFAULT 100,
-                    mana INTEGER DEFAULT 50,
-                    max_mana INTEGER DEFAULT 50,
-                    strength INTEGER DEFAULT 10,
-                    dexterity INTEGER DEFAULT 10,
-                    constitution INTEGER DEFAULT 10,
-                    intelligence INTEGER DEFAULT 10,
-                    wisdom INTEGER DEFAULT 10,
-                    charisma INTEGER DEFAULT 10,
-                    current_room INTEGER DEFAULT 1,
-                    inventory JSONB DEFAULT '[]',
-                    equipment JSONB DEFAULT '{}',
-                    status_line TEXT DEFAULT 'HP: {health}/{max_health} | MP: {mana}/{max_mana} | Room: {room_name}',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # Rooms table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS rooms (
-                    id SERIAL PRIMARY KEY,
-                    name VARCHAR(100) NOT NULL,
-                    description TEXT,
-                    exits JSONB DEFAULT '{}',
-                    items JSONB DEFAULT '[]',
-                    monsters JSONB DEFAULT '[]',
-                    properties JSONB DEFAULT '{}'
-                )
-            ''')
-
-            # Items table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS items (
-                    id SERIAL PRIMARY KEY,
-                    name VARCHAR(50) NOT NULL,
-                    description TEXT,
-                    item_type VARCHAR(20) NOT NULL,
-                    properties JSONB DEFAULT '{}',
-                    stats JSONB DEFAULT '{}'
-                )
-            ''')
-
-            # Monsters table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS monsters (
-                    id SERIAL PRIMARY KEY,
-                    name VARCHAR(50) NOT NULL,
-                    description TEXT,
-                    level INTEGER DEFAULT 1,
-                    health INTEGER DEFAULT 50,
-                    max_health INTEGER DEFAULT 50,
-                    attack INTEGER DEFAULT 5,
-                    defense INTEGER DEFAULT 2,
-                    experience_reward INTEGER DEFAULT 10,
-                    loot_table JSONB DEFAULT '[]',
-                    properties JSONB DEFAULT '{}'
-                )
-            ''')
-
-            # Room monsters table (for monster instances in rooms)
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS room_monsters (
-                    id SERIAL PRIMARY KEY,
-                    room_id INTEGER REFERENCES rooms(id),
-                    monster_id INTEGER REFERENCES monsters(id),
-                    health INTEGER NOT NULL,
-                    max_health INTEGER NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
+            await conn.execute(_SCHEMA_DDL)
 
     async def create_user(self, username: str, password: str, access_level: int = 1) -> bool:
         """Create a new user account"""
-        password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        password_hash = await _hash_password(password, self.bcrypt_rounds)
 
         if not self.pool:
             # Memory storage
             if username in self.users:
                 return False
-            self.users[username] = {
+            user = {
                 'id': len(self.users) + 1,
                 'username': username,
                 'password_hash': password_hash,
                 'access_level': access_level
             }
+            self.users[username] = user
+            self.users_by_id[user['id']] = user
             return True
 
         try:
@@ -180,22 +415,34 @@ class Database:
         if not self.pool:
             # Memory storage
             user = self.users.get(username)
-            if user and bcrypt.checkpw(password.encode('utf-8'), user['password_hash'].encode('utf-8')):
+            if user and await _check_password(password, user['password_hash']):
                 return user
             return None
 
         async with self.pool.acquire() as conn:
-            user = await conn.fetchrow(
-                'SELECT * FROM users WHERE username = $1', username
-            )
-            if user and bcrypt.checkpw(password.encode('utf-8'), user['password_hash'].encode('utf-8')):
-                await conn.execute(
-                    'UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = $1',
-                    user['id']
-                )
-                return dict(user)
+            user = await conn.fetchrow(_SQL_USER_BY_NAME, username)
+
+        # Verify with the connection back in the pool; the hash check is the slow part
+        if not user or not await _check_password(password, user['password_hash']):
             return None
 
+        # Don't hold the login on the last_login write; it goes out with the next batch
+        self._pending_logins.add(user['id'])
+        if self._login_flush_task is None or self._login_flush_task.done():
+            self._login_flush_task = asyncio.create_task(self._flush_last_logins())
+        return dict(user)
+
+    async def _flush_last_logins(self):
+        """Write pending last_login stamps once per interval until no logins are waiting"""
+        while self._pending_logins:
+            await asyncio.sleep(self.last_login_flush_interval)
+            user_ids, self._pending_logins = list(self._pending_logins), set()
+            try:
+                async with self.pool.acquire() as conn:
+                    await conn.execute(_SQL_TOUCH_LAST_LOGIN, user_ids)
+            except Exception as e:
+                print(f"Failed to update last_login: {e}")
+
     async def get_user_count(self) -> int:
         """Get total number of users"""
         if not self.pool:
@@ -206,17 +453,23 @@ class Database:
             count = await conn.fetchval('SELECT COUNT(*) FROM users')
             return count
 
-    async def create_character(self, user_id: int, name: str, race: str, char_class: str, stats: Dict) -> int:
-        """Create a new character"""
+    async def create_character(self, user_id: int, name: str, race: str, char_class: str, stats: Dict) -> Dict:
+        """Create a new character and return its full row; stats may set any other character column"""
         # Sanitize inputs
         sanitized_name = InputSanitizer.sanitize_character_name(name)
         sanitized_race = InputSanitizer.sanitize_string(race)
         sanitized_class = InputSanitizer.sanitize_string(char_class)
 
+        # The arguments above win over any identity keys repeated in stats
+        columns = {key: value for key, value in stats.items() if key not in _CHARACTER_IDENTITY}
+        for key in columns:
+            if not InputSanitizer.validate_db_column('characters', key):
+                raise ValueError(f"Invalid character column: {key}")
+
         if not self.pool:
             # Memory storage
             char_id = len(self.characters) + 1
-            self.characters[char_id] = {
+            self.characters[char_id] = Character(**{
                 'id': char_id,
                 'user_id': user_id,
                 'name': sanitized_name,
@@ -228,52 +481,33 @@ class Database:
                 'inventory': [],
                 'equipment': {},
                 'status_line': 'HP: {health}/{max_health} | MP: {mana}/{max_mana} | Room: {room_name}',
-                **stats
-            }
-            return char_id
+                **columns
+            })
+            self.characters_by_user.setdefault(user_id, char_id)
+            return self.characters[char_id]
 
+        # One INSERT carries every supplied column and hands back the row with its defaults filled in
+        extra = tuple(sorted(columns))
         async with self.pool.acquire() as conn:
-            char_id = await conn.fetchval('''
-                INSERT INTO characters (user_id, name, race, class, strength, dexterity,
-                                      constitution, intelligence, wisdom, charisma)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                RETURNING id
-            ''', user_id, sanitized_name, sanitized_race, sanitized_class, stats['strength'], stats['dexterity'],
-                stats['constitution'], stats['intelligence'], stats['wisdom'], stats['charisma'])
-            return char_id
+            row = await conn.fetchrow(_insert_character_sql(extra), user_id, sanitized_name, sanitized_race,
+                                      sanitized_class, *[columns[key] for key in extra])
+            return dict(row)
 
     async def get_character(self, user_id: int) -> Optional[Dict]:
         """Get character by user ID"""
         if not self.pool:
             # Memory storage
-            for char in self.characters.values():
-                if char['user_id'] == user_id:
-                    return char
-            return None
+            return self.characters.get(self.characters_by_user.get(user_id))
 
         async with self.pool.acquire() as conn:
-            char = await conn.fetchrow(
-                'SELECT * FROM characters WHERE user_id = $1', user_id
-            )
+            char = await conn.fetchrow(_SQL_CHARACTER_BY_USER, user_id)
             if char:
                 char_dict = dict(char)
-                # Parse JSONB fields from strings to Python objects
-                if 'inventory' in char_dict:
-                    if isinstance(char_dict['inventory'], str):
-                        try:
-                            char_dict['inventory'] = json.loads(char_dict['inventory'])
-                        except (json.JSONDecodeError, TypeError):
-                            char_dict['inventory'] = []
-                    elif char_dict['inventory'] is None:
-                        char_dict['inventory'] = []
-                if 'equipment' in char_dict:
-                    if isinstance(char_dict['equipment'], str):
-                        try:
-                            char_dict['equipment'] = json.loads(char_dict['equipment'])
-                        except (json.JSONDecodeError, TypeError):
-                            char_dict['equipment'] = {}
-                    elif char_dict['equipment'] is None:
-                        char_dict['equipment'] = {}
+                # The jsonb codec already returns lists/dicts; only NULL columns need defaults
+                if char_dict.get('inventory') is None:
+                    char_dict['inventory'] = []
+                if char_dict.get('equipment') is None:
+                    char_dict['equipment'] = {}
                 return char_dict
             return None
 
@@ -285,31 +519,63 @@ class Database:
                 self.characters[char_id].update(updates)
             return
 
-        # Build dynamic update query
-        set_clauses = []
-        values = []
-        for i, (key, value) in enumerate(updates.items(), 1):
-            if key in ['inventory', 'equipment']:
-                set_clauses.append(f"{key} = ${i}")
-                values.append(json.dumps(value))
-            else:
-                set_clauses.append(f"{key} = ${i}")
-                values.append(value)
-
-        values.append(char_id)
-        query = f"UPDATE characters SET {', '.join(set_clauses)} WHERE id = ${len(values)}"
+        # Same column set -> same SQL text, whatever the dict order; jsonb objects go straight to the codec
+        columns = tuple(sorted(updates))
+        query = _update_character_sql(columns)
 
         async with self.pool.acquire() as conn:
-            await conn.execute(query, *values)
+            await conn.execute(query, *[updates[column] for column in columns], char_id)
+
+    async def _cached_row(self, table: str, sql: str, row_id: int):
+        """Fetch a row by id through the TTL cache; concurrent misses share one query.
+
+        Returns the immutable asyncpg Record itself, so every hit shares it without copying.
+        """
+        key = (table, row_id)
+        entry = self._row_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        fetch = self._row_fetches.get(key)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_row(key, sql, row_id))
+            self._row_fetches[key] = fetch
+        # Shield so one cancelled waiter doesn't cancel the query for the others
+        return await asyncio.shield(fetch)
+
+    async def _fetch_row(self, key: Tuple[str, int], sql: str, row_id: int):
+        """Load one row and store it in the cache unless it was invalidated meanwhile"""
+        gen = self._row_cache_gen
+        try:
+            async with self.pool.acquire() as conn:
+                record = await conn.fetchrow(sql, row_id)
+            if record is not None and gen == self._row_cache_gen:
+                if len(self._row_cache) >= self.row_cache_max:
+                    del self._row_cache[next(iter(self._row_cache))]  # Drop the oldest entry
+                self._row_cache[key] = (time.monotonic() + self.row_cache_ttl, record)
+            return record
+        finally:
+            self._row_fetches.pop(key, None)
+
+    def invalidate_row(self, table: str, row_id: int):
+        """Forget a cached room/item/monster row after it has been modified"""
+        self._row_cache.pop((table, row_id), None)
+        self._row_cache_gen += 1
 
     async def get_room(self, room_id: int) -> Optional[Dict]:
-        """Get room by ID"""
+        """Get room by ID (read-only row)"""
         if not self.pool:
             return self.rooms.get(room_id)
 
+        return await self._cached_row('rooms', _SQL_ROOM_BY_ID, room_id)
+
+    async def get_room_links(self, room_ids: List[int]) -> List[Dict]:
+        """Get id, name and exits for several rooms in one query"""
+        if not self.pool:
+            return [self.rooms[room_id] for room_id in room_ids if room_id in self.rooms]
+
         async with self.pool.acquire() as conn:
-            room = await conn.fetchrow('SELECT * FROM rooms WHERE id = $1', room_id)
-            return dict(room) if room else None
+            return await conn.fetch('SELECT id, name, exits FROM rooms WHERE id = ANY($1::int[])', list(room_ids))
 
     async def create_room(self, name: str, description: str, properties: Dict = None) -> int:
         """Create a new room"""
@@ -323,68 +589,55 @@ class Database:
 
             if not self.pool:
                 room_id = len(self.rooms) + 1
-                self.rooms[room_id] = {
-                    'id': room_id,
-                    'name': sanitized_name,
-                    'description': sanitized_description,
-                    'exits': {},
-                    'items': [],
-                    'monsters': [],
-                    'properties': properties
-                }
+                self.rooms[room_id] = Room(
+                    id=room_id,
+                    name=sanitized_name,
+                    description=sanitized_description,
+                    exits={},
+                    items=[],
+                    monsters=[],
+                    properties=properties
+                )
                 return room_id
 
             async with self.pool.acquire() as conn:
                 room_id = await conn.fetchval('''
                     INSERT INTO rooms (name, description, properties)
                     VALUES ($1, $2, $3) RETURNING id
-                ''', sanitized_name, sanitized_description, json.dumps(properties))
+                ''', sanitized_name, sanitized_description, properties)
                 return room_id
         except ValueError as e:
             print(f"Input validation error in create_room: {e}")
             raise
 
-    async def link_rooms(self, room1_id: int, direction: str, room2_id: int):
-        """Link two rooms with a directional exit"""
-        opposite_dirs = {
-            'north': 'south', 'south': 'north',
-            'east': 'west', 'west': 'east',
-            'up': 'down', 'down': 'up'
-        }
-
+    async def link_rooms(self, room1_id: int, direction: str, room2_id: int, conn=None):
+        """Link two rooms with a directional exit, optionally on a caller's connection"""
         if not self.pool:
             if room1_id in self.rooms:
                 self.rooms[room1_id]['exits'][direction] = room2_id
-            if room2_id in self.rooms and direction in opposite_dirs:
-                self.rooms[room2_id]['exits'][opposite_dirs[direction]] = room1_id
+            if room2_id in self.rooms and direction in _OPPOSITE_DIRS:
+                self.rooms[room2_id]['exits'][_OPPOSITE_DIRS[direction]] = room1_id
             return
 
-        async with self.pool.acquire() as conn:
-            # Update room1 exits
-            room1 = await conn.fetchrow('SELECT exits FROM rooms WHERE id = $1', room1_id)
-            if room1:
-                exits_data = room1['exits'] if room1['exits'] is not None else {}
-                exits_data[direction] = room2_id
-                await conn.execute('UPDATE rooms SET exits = $1 WHERE id = $2',
-                                 json.dumps(exits_data), room1_id)
-
-            # Update room2 exits (bidirectional)
-            if direction in opposite_dirs:
-                room2 = await conn.fetchrow('SELECT exits FROM rooms WHERE id = $1', room2_id)
-                if room2:
-                    exits_data = room2['exits'] if room2['exits'] is not None else {}
-                    exits_data[opposite_dirs[direction]] = room1_id
-                    await conn.execute('UPDATE rooms SET exits = $1 WHERE id = $2',
-                                     json.dumps(exits_data), room2_id)
+        if conn is None:
+            async with self.pool.acquire() as conn:
+                return await self.link_rooms(room1_id, direction, room2_id, conn=conn)
+
+        # Merge each new exit into the stored object server-side; executemany sends both
+        # rows in one pipelined, atomic batch
+        links = [({direction: room2_id}, room1_id)]
+        if direction in _OPPOSITE_DIRS:
+            links.append(({_OPPOSITE_DIRS[direction]: room1_id}, room2_id))
+        await conn.executemany(_SQL_MERGE_EXITS, links)
+        for _, room_id in links:
+            self.invalidate_row('rooms', room_id)
 
     async def get_item(self, item_id: int) -> Optional[Dict]:
-        """Get item by ID"""
+        """Get item by ID (read-only row)"""
         if not self.pool:
             return self.items.get(item_id)
 
-        async with self.pool.acquire() as conn:
-            item = await conn.fetchrow('SELECT * FROM items WHERE id = $1', item_id)
-            return dict(item) if item else None
+        return await self._cached_row('items', _SQL_ITEM_BY_ID, item_id)
 
     async def create_item(self, name: str, description: str, item_type: str,
                          properties: Dict = None, stats: Dict = None) -> int:
@@ -396,31 +649,46 @@ class Database:
 
         if not self.pool:
             item_id = len(self.items) + 1
-            self.items[item_id] = {
-                'id': item_id,
-                'name': name,
-                'description': description,
-                'item_type': item_type,
-                'properties': properties,
-                'stats': stats
-            }
+            self.items[item_id] = Item(
+                id=item_id,
+                name=name,
+                description=description,
+                item_type=item_type,
+                properties=properties,
+                stats=stats
+            )
             return item_id
 
         async with self.pool.acquire() as conn:
             item_id = await conn.fetchval('''
                 INSERT INTO items (name, description, item_type, properties, stats)
                 VALUES ($1, $2, $3, $4, $5) RETURNING id
-            ''', name, description, item_type, json.dumps(properties), json.dumps(stats))
+            ''', name, description, item_type, properties, stats)
             return item_id
 
+    async def bulk_create_items(self, rows: List[Tuple]) -> int:
+        """Create many items at once from (name, description, item_type, properties, stats) tuples"""
+        if not self.pool:
+            for name, description, item_type, properties, stats in rows:
+                await self.create_item(name, description, item_type, properties, stats)
+            return len(rows)
+
+        # Binary COPY streams every row in one operation; jsonb values go through the codec
+        records = [(name, description, item_type, properties or {}, stats or {})
+                   for name, description, item_type, properties, stats in rows]
+        async with self.pool.acquire() as conn:
+            await conn.copy_records_to_table(
+                'items', records=records,
+                columns=['name', 'description', 'item_type', 'properties', 'stats']
+            )
+        return len(records)
+
     async def get_monster(self, monster_id: int) -> Optional[Dict]:
-        """Get monster by ID"""
+        """Get monster by ID (read-only row)"""
         if not self.pool:
             return self.monsters.get(monster_id)
 
-        async with self.pool.acquire() as conn:
-            monster = await conn.fetchrow('SELECT * FROM monsters WHERE id = $1', monster_id)
-            return dict(monster) if monster else None
+        return await self._cached_row('monsters', _SQL_MONSTER_BY_ID, monster_id)
 
     async def create_monster(self, name: str, description: str, level: int,
                            health: int, attack: int, defense: int,
@@ -431,27 +699,23 @@ class Database:
 
         if not self.pool:
             monster_id = len(self.monsters) + 1
-            self.monsters[monster_id] = {
-                'id': monster_id,
-                'name': name,
-                'description': description,
-                'level': level,
-                'health': health,
-                'max_health': health,
-                'attack': attack,
-                'defense': defense,
-                'experience_reward': experience_reward,
-                'loot_table': loot_table
-            }
+            self.monsters[monster_id] = Monster(
+                id=monster_id,
+                name=name,
+                description=description,
+                level=level,
+                health=health,
+                max_health=health,
+                attack=attack,
+                defense=defense,
+                experience_reward=experience_reward,
+                loot_table=loot_table
+            )
             return monster_id
 
         async with self.pool.acquire() as conn:
-            monster_id = await conn.fetchval('''
-                INSERT INTO monsters (name, description, level, health, max_health,
-                                    attack, defense, experience_reward, loot_table)
-                VALUES ($1, $2, $3, $4, $4, $5, $6, $7, $8) RETURNING id
-            ''', name, description, level, health, attack, defense,
-                experience_reward, json.dumps(loot_table))
+            monster_id = await conn.fetchval(_SQL_CREATE_MONSTER, name, description, level, health,
+                                             attack, defense, experience_reward, loot_table)
             return monster_id
 
     async def get_room_monsters(self, room_id: int) -> List[Dict]:
@@ -486,9 +750,7 @@ class Database:
             return
 
         async with self.pool.acquire() as conn:
-            await conn.execute('''
-                UPDATE room_monsters SET health = $1 WHERE id = $2
-            ''', health, instance_id)
+            await conn.execute(_SQL_ROOM_MONSTER_HEALTH, health, instance_id)
 
     async def update_room_monster_room(self, instance_id: int, new_room_id: int):
         """Move a monster instance to a different room"""
@@ -525,26 +787,11 @@ class Database:
             return False
 
         async with self.pool.acquire() as conn:
-            # Get current items
-            room = await conn.fetchrow('SELECT items FROM rooms WHERE id = $1', room_id)
-            if not room:
-                return False
-
-            items = room['items'] if room['items'] is not None else []
-            if isinstance(items, str):
-                try:
-                    items = json.loads(items)
-                except (json.JSONDecodeError, TypeError):
-                    items = []
-
-            # Add new item
-            item_data = {'item_id': item_id, 'hidden': hidden}
-            items.append(item_data)
-
-            # Update room
-            await conn.execute('UPDATE rooms SET items = $1 WHERE id = $2',
-                             json.dumps(items), room_id)
-            return True
+            # Append server-side; no row back means the room does not exist
+            added = await conn.fetchval(_SQL_APPEND_ROOM_ITEM,
+                                        [{'item_id': item_id, 'hidden': hidden}], room_id)
+        self.invalidate_row('rooms', room_id)
+        return added is not None
 
     async def remove_item_from_room(self, room_id: int, item_id: int) -> bool:
         """Remove an item from a room's items list"""
@@ -557,25 +804,10 @@ class Database:
             return False
 
         async with self.pool.acquire() as conn:
-            # Get current items
-            room = await conn.fetchrow('SELECT items FROM rooms WHERE id = $1', room_id)
-            if not room:
-                return False
-
-            items = room['items'] if room['items'] is not None else []
-            if isinstance(items, str):
-                try:
-                    items = json.loads(items)
-                except (json.JSONDecodeError, TypeError):
-                    items = []
-
-            # Remove item
-            items = [item for item in items if item.get('item_id') != item_id]
-
-            # Update room
-            await conn.execute('UPDATE rooms SET items = $1 WHERE id = $2',
-                             json.dumps(items), room_id)
-            return True
+            # Filter the array server-side, keeping the order of the remaining entries
+            removed = await conn.fetchval(_SQL_REMOVE_ROOM_ITEM, item_id, room_id)
+        self.invalidate_row('rooms', room_id)
+        return removed is not None
 
     async def get_room_items(self, room_id: int) -> List[Dict]:
         """Get all items in a room with their details"""
@@ -586,37 +818,15 @@ class Database:
                 for item_data in self.rooms[room_id]['items']:
                     item = self.items.get(item_data['item_id'])
                     if item:
-                        item_copy = item.copy()
+                        item_copy = dict(item)
                         item_copy['hidden'] = item_data.get('hidden', False)
                         room_items.append(item_copy)
                 return room_items
             return []
 
         async with self.pool.acquire() as conn:
-            # Get room items
-            room = await conn.fetchrow('SELECT items FROM rooms WHERE id = $1', room_id)
-            if not room:
-                return []
-
-            items = room['items'] if room['items'] is not None else []
-            if isinstance(items, str):
-                try:
-                    items = json.loads(items)
-                except (json.JSONDecodeError, TypeError):
-                    items = []
-
-            # Get item details
-            room_items = []
-            for item_data in items:
-                item_id = item_data.get('item_id')
-                if item_id:
-                    item = await conn.fetchrow('SELECT * FROM items WHERE id = $1', item_id)
-                    if item:
-                        item_dict = dict(item)
-                        item_dict['hidden'] = item_data.get('hidden', False)
-                        room_items.append(item_dict)
-
-            return room_items
+            # Expand the room's items array and join the item rows in one query, keeping list order
+            return await conn.fetch(_SQL_ROOM_ITEMS, room_id)
 
 # Global database instance
 db = Database()
\ No newline at end of file
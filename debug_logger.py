@@ -4,7 +4,10 @@ Debug Logging System for SSH RPG Server
 Provides configurable debug logging with different verbosity levels and component filtering
 """
 
+import atexit
+import queue
 import sys
+import threading
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional
@@ -19,6 +22,32 @@ class DebugLogger:
     VERBOSE = 2
     VERY_VERBOSE = 3
     
+    # File write modes
+    DIRECT = 'direct'                        # Flush after every line
+    BUFFER_AND_FLUSH = 'buffer_and_flush'    # Buffer lines, flush every flush_interval seconds
+    BUFFER_DONT_FLUSH = 'buffer_dont_flush'  # Buffer lines, flush only when the buffer fills or on close
+    WRITE_MODES = (DIRECT, BUFFER_AND_FLUSH, BUFFER_DONT_FLUSH)
+    
+    _QUEUE_SIZE = 10000   # Messages waiting for the writer thread before log() starts dropping
+    _WRITER_BATCH = 128   # Messages formatted and written per batch
+    _LEVEL_STR = ("MIN", "NOR", "VER", "VVR")
+    
+    # One bit per component; the enabled components are kept as a mask of these
+    _ADMIN_BIT = 1
+    _DATABASE_BIT = 2
+    _GAME_ENGINE_BIT = 4
+    _SERVER_BIT = 8
+    _CHARACTER_CREATION_BIT = 16
+    _COMBAT_BIT = 32
+    _COMPONENT_BITS = {
+        'admin_commands': _ADMIN_BIT,
+        'database': _DATABASE_BIT,
+        'game_engine': _GAME_ENGINE_BIT,
+        'server': _SERVER_BIT,
+        'character_creation': _CHARACTER_CREATION_BIT,
+        'combat': _COMBAT_BIT
+    }
+    
     def __init__(self):
         self.enabled = False
         self.verbosity = self.NORMAL
@@ -30,10 +59,29 @@ class DebugLogger:
             'character_creation': False,
             'combat': False
         }
+        self._enabled_mask = 0
+        self._refresh_components()
+        self._component_tag = {c: f"[{c.upper()}]" for c in self.components}
         self.output_console = True
         self.output_file = False
         self.file_path = "debug.log"
         self._file_handle = None
+        
+        # File buffering; the file object's own buffer batches lines into few write() calls
+        self.write_mode = self.BUFFER_AND_FLUSH
+        self.buffer_size = 64 * 1024
+        self.flush_interval = 0.5
+        self._file_lock = threading.Lock()  # The writer thread shares the file with open/close
+        
+        # log() only enqueues; a background thread formats and does the console/file I/O
+        self._queue = queue.Queue(maxsize=self._QUEUE_SIZE)
+        self._writer = None
+        self.dropped = 0
+        
+        # HH:MM:SS of the last formatted second; only the writer thread formats messages
+        self._last_sec = None
+        self._last_hms = ""
+        atexit.register(self._shutdown)  # Don't lose the tail of the log on a normal exit
     
     def configure(self, config: Dict[str, Any]):
         """Configure debug logger from config dictionary"""
@@ -47,16 +95,23 @@ class DebugLogger:
         for component, enabled in components_config.items():
             if component in self.components:
                 self.components[component] = enabled
+        self._refresh_components()
         
         # Update output settings
         output_config = debug_config.get('output', {})
         self.output_console = output_config.get('console', True)
         self.output_file = output_config.get('file', False)
         self.file_path = output_config.get('file_path', "debug.log")
+        write_mode = output_config.get('write_mode', self.BUFFER_AND_FLUSH)
+        self.write_mode = write_mode if write_mode in self.WRITE_MODES else self.BUFFER_AND_FLUSH
+        self.buffer_size = output_config.get('buffer_size', 64 * 1024)
+        self.flush_interval = output_config.get('flush_interval', 0.5)
         
         # Open file if needed
         if self.output_file and self.enabled:
             self._open_file()
+        if self.enabled:
+            self._start_writer()
     
     def enable(self, verbosity: int = NORMAL):
         """Enable debug logging with specified verbosity"""
@@ -64,21 +119,34 @@ class DebugLogger:
         self.verbosity = verbosity
         if self.output_file:
             self._open_file()
+        self._start_writer()
     
     def disable(self):
         """Disable debug logging"""
         self.enabled = False
-        self._close_file()
+        self._shutdown()
     
     def set_component(self, component: str, enabled: bool):
         """Enable/disable logging for a specific component"""
         if component in self.components:
             self.components[component] = enabled
+            self._refresh_components()
+    
+    def _refresh_components(self):
+        """Recompute the enabled-component bitmask used by the log filter"""
+        mask = 0
+        for component, enabled in self.components.items():
+            if enabled:
+                mask |= self._COMPONENT_BITS[component]
+        self._enabled_mask = mask
     
     def _open_file(self):
         """Open debug log file"""
+        if self._file_handle:
+            return
         try:
-            self._file_handle = open(self.file_path, 'a', encoding='utf-8')
+            # Binary mode: each batch is encoded once and skips the TextIOWrapper layer
+            self._file_handle = open(self.file_path, 'ab', buffering=self.buffer_size)
             self._write_to_file(f"\n=== Debug session started at {datetime.now()} ===\n")
         except Exception as e:
             print(f"Warning: Could not open debug log file {self.file_path}: {e}")
@@ -89,72 +157,159 @@ class DebugLogger:
         if self._file_handle:
             try:
                 self._write_to_file(f"=== Debug session ended at {datetime.now()} ===\n")
-                self._file_handle.close()
+                with self._file_lock:
+                    self._file_handle.close()
             except:
                 pass
             self._file_handle = None
     
+    def _start_writer(self):
+        """Start the background writer thread if it isn't running"""
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._writer_loop, name='debug-log-writer', daemon=True)
+            self._writer.start()
+    
+    def _shutdown(self):
+        """Drain queued messages, stop the writer thread and close the file"""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=5)
+        self._writer = None
+        self._close_file()
+    
+    def _writer_loop(self):
+        """Format and write queued messages in batches until a None sentinel arrives"""
+        last_flush = time.monotonic()
+        running = True
+        while running:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                batch = []
+            while len(batch) < self._WRITER_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            lines = []
+            waiters = []
+            for item in batch:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)  # flush() request
+                else:
+                    lines.append(self._format_message(*item) + "\n")
+            
+            if lines:
+                text = "".join(lines)
+                if self.output_console:
+                    sys.stdout.write(text)
+                if self.output_file:
+                    self._write_to_file(text)
+            
+            now = time.monotonic()
+            if waiters or self.write_mode == self.DIRECT or (
+                    self.write_mode == self.BUFFER_AND_FLUSH and now - last_flush >= self.flush_interval):
+                self._flush_file()
+                last_flush = now
+            for waiter in waiters:
+                waiter.set()
+    
     def _write_to_file(self, message: str):
         """Write message to debug file"""
         if self._file_handle:
             try:
-                self._file_handle.write(message)
-                self._file_handle.flush()
+                data = message.encode('utf-8')
+                with self._file_lock:
+                    self._file_handle.write(data)
+            except:
+                pass
+    
+    def _flush_file(self):
+        """Push buffered debug file output to the OS"""
+        if self._file_handle:
+            try:
+                with self._file_lock:
+                    self._file_handle.flush()
             except:
                 pass
     
-    def _format_message(self, component: str, message: str, level: int) -> str:
+    def flush(self):
+        """Wait until queued messages are written and the debug file is flushed"""
+        if self._writer is not None and self._writer.is_alive():
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait(timeout=5)
+        else:
+            self._flush_file()
+    
+    def _format_message(self, component: str, message: str, level: int, created: float) -> str:
         """Format debug message with timestamp and component"""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]  # Include milliseconds
-        level_str = ["MIN", "NOR", "VER", "VVR"][min(level, 3)]
-        return f"[{timestamp}] DEBUG-{level_str} [{component.upper()}] {message}"
+        sec = int(created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_hms = time.strftime("%H:%M:%S", time.localtime(sec))
+        ms = int((created - sec) * 1000)
+        level_str = self._LEVEL_STR[min(level, 3)]
+        return f"[{self._last_hms}.{ms:03d}] DEBUG-{level_str} {self._component_tag[component]} {message}"
     
-    def log(self, component: str, message: str, level: int = NORMAL):
-        """Log a debug message"""
-        if not self.enabled:
-            return
-        
-        # Check if component is enabled
-        if component not in self.components or not self.components[component]:
-            return
-        
-        # Check verbosity level
-        if level > self.verbosity:
-            return
-        
-        formatted_message = self._format_message(component, message, level)
-        
-        # Output to console
-        if self.output_console:
-            print(formatted_message)
+    def is_enabled(self, component: str, level: int = NORMAL) -> bool:
+        """Check whether a message for component at level would be logged"""
+        return (self.enabled and level <= self.verbosity
+                and bool(self._enabled_mask & self._COMPONENT_BITS.get(component, 0)))
+    
+    def log(self, component: str, message: str, *args, level: int = NORMAL):
+        """Log a debug message; %-style args are only formatted if the message passes the filter"""
+        # Enabled, component switched on, verbosity high enough
+        if (self.enabled and self._enabled_mask & self._COMPONENT_BITS.get(component, 0)
+                and level <= self.verbosity):
+            self._emit(component, message, args, level)
+    
+    def _emit(self, component: str, message: str, args: tuple, level: int):
+        """Queue a message that already passed the filter for the writer thread"""
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args!r}"  # Bad format string; keep the data rather than raise
         
-        # Output to file
-        if self.output_file:
-            self._write_to_file(formatted_message + "\n")
+        # Line formatting and output happen on the writer thread
+        try:
+            self._queue.put_nowait((component, message, level, time.time()))
+        except queue.Full:
+            self.dropped += 1
     
-    def admin(self, message: str, level: int = NORMAL):
+    def admin(self, message: str, *args, level: int = NORMAL):
         """Log admin command debug message"""
-        self.log('admin_commands', message, level)
+        if self.enabled and self._enabled_mask & self._ADMIN_BIT and level <= self.verbosity:
+            self._emit('admin_commands', message, args, level)
     
-    def database(self, message: str, level: int = NORMAL):
+    def database(self, message: str, *args, level: int = NORMAL):
         """Log database debug message"""
-        self.log('database', message, level)
+        if self.enabled and self._enabled_mask & self._DATABASE_BIT and level <= self.verbosity:
+            self._emit('database', message, args, level)
     
-    def game_engine(self, message: str, level: int = NORMAL):
+    def game_engine(self, message: str, *args, level: int = NORMAL):
         """Log game engine debug message"""
-        self.log('game_engine', message, level)
+        if self.enabled and self._enabled_mask & self._GAME_ENGINE_BIT and level <= self.verbosity:
+            self._emit('game_engine', message, args, level)
     
-    def server(self, message: str, level: int = NORMAL):
+    def server(self, message: str, *args, level: int = NORMAL):
         """Log server debug message"""
-        self.log('server', message, level)
+        if self.enabled and self._enabled_mask & self._SERVER_BIT and level <= self.verbosity:
+            self._emit('server', message, args, level)
     
-    def character_creation(self, message: str, level: int = NORMAL):
+    def character_creation(self, message: str, *args, level: int = NORMAL):
         """Log character creation debug message"""
-        self.log('character_creation', message, level)
+        if self.enabled and self._enabled_mask & self._CHARACTER_CREATION_BIT and level <= self.verbosity:
+            self._emit('character_creation', message, args, level)
     
-    def combat(self, message: str, level: int = NORMAL):
+    def combat(self, message: str, *args, level: int = NORMAL):
         """Log combat debug message"""
-        self.log('combat', message, level)
+        if self.enabled and self._enabled_mask & self._COMBAT_BIT and level <= self.verbosity:
+            self._emit('combat', message, args, level)
     
     def get_status(self) -> str:
         """Get current debug logger status"""
@@ -171,33 +326,43 @@ class DebugLogger:
         status += f"Output: Console={self.output_console}, File={self.output_file}"
         if self.output_file:
             status += f" ({self.file_path})"
+        if self.dropped:
+            status += f"\nDropped messages: {self.dropped}"
         
         return status
 
 # Global debug logger instance
 debug_logger = DebugLogger()
 
-# Convenience functions for easy access
-def debug_admin(message: str, level: int = DebugLogger.NORMAL):
+# Convenience functions for easy access; the enabled check skips the method call when logging is off.
+# Pass values as %-style args, e.g. debug_combat("hit %s for %d", target, damage), so they are
+# only formatted when the message is actually logged.
+def debug_admin(message: str, *args, level: int = DebugLogger.NORMAL):
     """Log admin command debug message"""
-    debug_logger.admin(message, level)
+    if debug_logger.enabled:
+        debug_logger.admin(message, *args, level=level)
 
-def debug_database(message: str, level: int = DebugLogger.NORMAL):
+def debug_database(message: str, *args, level: int = DebugLogger.NORMAL):
     """Log database debug message"""
-    debug_logger.database(message, level)
+    if debug_logger.enabled:
+        debug_logger.database(message, *args, level=level)
 
-def debug_game_engine(message: str, level: int = DebugLogger.NORMAL):
+def debug_game_engine(message: str, *args, level: int = DebugLogger.NORMAL):
     """Log game engine debug message"""
-    debug_logger.game_engine(message, level)
+    if debug_logger.enabled:
+        debug_logger.game_engine(message, *args, level=level)
 
-def debug_server(message: str, level: int = DebugLogger.NORMAL):
+def debug_server(message: str, *args, level: int = DebugLogger.NORMAL):
     """Log server debug message"""
-    debug_logger.server(message, level)
+    if debug_logger.enabled:
+        debug_logger.server(message, *args, level=level)
 
-def debug_character_creation(message: str, level: int = DebugLogger.NORMAL):
+def debug_character_creation(message: str, *args, level: int = DebugLogger.NORMAL):
     """Log character creation debug message"""
-    debug_logger.character_creation(message, level)
+    if debug_logger.enabled:
+        debug_logger.character_creation(message, *args, level=level)
 
-def debug_combat(message: str, level: int = DebugLogger.NORMAL):
+def debug_combat(message: str, *args, level: int = DebugLogger.NORMAL):
     """Log combat debug message"""
-    debug_logger.combat(message, level)
\ No newline at end of file
+    if debug_logger.enabled:
+        debug_logger.combat(message, *args, level=level)
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+Dice kernels for character stat rolling.
+Compiled with numba when available; callers fall back to NumPy or pure Python.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def roll6():
+        """Roll six 4d6-drop-lowest totals"""
+        out = np.empty(6, np.int32)
+        for i in range(6):
+            total = 0
+            lowest = 6
+            for _ in range(4):
+                die = np.random.randint(1, 7)
+                total += die
+                if die < lowest:
+                    lowest = die
+            out[i] = total - lowest
+        return out
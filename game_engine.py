@@ -1,10 +1,10 @@
 import asyncio
 import random
 import time
+from collections import deque
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
-import json
 from input_sanitizer import InputSanitizer
 
 @dataclass
@@ -52,11 +52,13 @@ class Player:
     def __init__(self, user_id: int, character_data: Dict, connection):
         self.user_id = user_id
         self.character = character_data
+        self.name_lower = character_data['name'].lower()  # Key for name lookups
         self.connection = connection
         self.pending_actions = []
         self.action_cooldown = 0
         self.last_activity = time.time()
         self.is_online = True
+        self.broadcast_cursor = 0  # Last broadcast_log seq delivered to this player
         
     def add_action(self, action: Action):
         """Add an action to the player's queue"""
@@ -84,11 +86,16 @@ class GameEngine:
     def __init__(self, database):
         self.db = database
         self.players: Dict[int, Player] = {}
+        self.players_by_name: Dict[str, Player] = {}  # Lowercased character name -> Player
         self.tick_rate = 2.0  # Ticks per second
         self.current_tick = 0
         self.running = False
         self.event_queue = []
         
+        # Server-wide broadcasts as (seq, text, color), sent to each player on the next tick
+        self.broadcast_log = deque()
+        self._broadcast_seq = 0
+        
         # Game world state
         self.room_instances = {}  # Runtime room state
         self.monster_instances = {}  # Active monsters
@@ -143,9 +150,39 @@ class GameEngine:
         # Clean up disconnected players
         await self._cleanup_players()
         
+        # Deliver pending broadcasts
+        await self._deliver_broadcasts()
+        
         # Process events
         await self._process_events()
     
+    def post_broadcast(self, text: str, color: str = "white"):
+        """Queue a message for every online player; delivered on the next tick"""
+        self._broadcast_seq += 1
+        self.broadcast_log.append((self._broadcast_seq, text, color))
+    
+    async def _deliver_broadcasts(self):
+        """Send each player the broadcast entries past their cursor, then trim the log"""
+        if not self.broadcast_log:
+            return
+        
+        entries = list(self.broadcast_log)
+        last_seq = entries[-1][0]
+        
+        async def deliver(player: Player):
+            for seq, text, color in entries:
+                if seq > player.broadcast_cursor:
+                    await player.send_message(text, color)
+            player.broadcast_cursor = last_seq
+        
+        await asyncio.gather(*(deliver(p) for p in list(self.players.values())
+                               if p.broadcast_cursor < last_seq))
+        
+        # Drop entries every connected player has seen
+        floor = min((p.broadcast_cursor for p in self.players.values()), default=last_seq)
+        while self.broadcast_log and self.broadcast_log[0][0] <= floor:
+            self.broadcast_log.popleft()
+    
     async def _process_actions(self):
         """Process all pending player actions"""
         for player in self.players.values():
@@ -214,13 +251,7 @@ class GameEngine:
             await player.send_message("You are in an invalid location!", "red")
             return
         
-        exits = room.get('exits', {})
-        # Handle case where exits might be a JSON string from PostgreSQL
-        if isinstance(exits, str):
-            try:
-                exits = json.loads(exits)
-            except (json.JSONDecodeError, TypeError):
-                exits = {}
+        exits = room.get('exits') or {}
         
         if direction not in exits:
             await player.send_message(f"You cannot go {direction} from here.", "yellow")
@@ -326,13 +357,7 @@ class GameEngine:
         # Check if room is a safe zone
         room = await self.db.get_room(room_id)
         if room:
-            properties = room.get('properties', {})
-            # Handle case where properties might be a JSON string from PostgreSQL
-            if isinstance(properties, str):
-                try:
-                    properties = json.loads(properties)
-                except (json.JSONDecodeError, TypeError):
-                    properties = {}
+            properties = room.get('properties') or {}
             
             if properties.get('safe_zone', False):
                 await player.send_message("You cannot attack in this sacred place!", "yellow")
@@ -534,20 +559,8 @@ class GameEngine:
         await player.send_message(f"{room['description']}", "light_green")
         
         # Show exits in blue
-        exits = room.get('exits', {})
-        print(f"DEBUG: exits type: {type(exits)}, value: {repr(exits)}")
-        # Handle case where exits might be a JSON string from PostgreSQL
-        if isinstance(exits, str):
-            print(f"DEBUG: exits is string, parsing...")
-            try:
-                exits = json.loads(exits)
-                print(f"DEBUG: parsed exits: {type(exits)}, value: {repr(exits)}")
-            except (json.JSONDecodeError, TypeError) as e:
-                print(f"DEBUG: JSON parsing failed: {e}")
-                exits = {}
-        
-        if exits and isinstance(exits, dict):
-            print(f"DEBUG: about to call exits.keys() on: {type(exits)}")
+        exits = room.get('exits')
+        if exits:
             await player.send_message(f"Exits: {', '.join(exits.keys())}", "blue")
         
         # Show other players
@@ -728,7 +741,7 @@ class GameEngine:
                 disconnected.append(pid)
         
         for pid in disconnected:
-            del self.players[pid]
+            self._unindex_player(self.players.pop(pid))
         
         # Cleanup completed silently
     
@@ -789,7 +802,9 @@ class GameEngine:
     async def add_player(self, user_id: int, character_data: Dict, connection):
         """Add a player to the game"""
         player = Player(user_id, character_data, connection)
+        player.broadcast_cursor = self._broadcast_seq  # Only broadcasts posted after login
         self.players[user_id] = player
+        self.players_by_name[player.name_lower] = player
         
         # Welcome message
         await player.send_message(f"Welcome to the world, {character_data['name']}!", "green")
@@ -808,6 +823,16 @@ class GameEngine:
                 exclude_player=user_id)
             
             del self.players[user_id]
+            self._unindex_player(player)
+    
+    def _unindex_player(self, player: Player):
+        """Drop a player from the name index if the entry still points at them"""
+        if self.players_by_name.get(player.name_lower) is player:
+            del self.players_by_name[player.name_lower]
+    
+    def get_player_by_name(self, name: str) -> Optional[Player]:
+        """Find an online player by character name (case-insensitive)"""
+        return self.players_by_name.get(name.lower())
     
     async def process_command(self, user_id: int, command: str) -> bool:
         """Process a command from a player"""
@@ -991,10 +1016,8 @@ its - look/l - Look around the current room
             
             if not db.pool:
                 # Memory storage fallback
-                for user in db.users.values():
-                    if user.get('id') == player.user_id:
-                        has_admin = user.get('access_level', 1) >= 2
-                        break
+                user = db.users_by_id.get(player.user_id)
+                has_admin = bool(user and user.get('access_level', 1) >= 2)
             else:
                 async with db.pool.acquire() as conn:
                     user = await conn.fetchrow('SELECT * FROM users WHERE id = $1', player.user_id)
@@ -1299,14 +1322,7 @@ statusline help - Show this help
         # Get exits
         exits = []
         if room and room.get('exits'):
-            room_exits = room['exits']
-            if isinstance(room_exits, str):
-                try:
-                    import json
-                    room_exits = json.loads(room_exits)
-                except:
-                    room_exits = {}
-            exits = list(room_exits.keys()) if room_exits else []
+            exits = list(room['exits'].keys())
         
         # Format variables
         format_vars = {
@@ -7,6 +7,7 @@ XSS attacks, and other security vulnerabilities.
 
 import re
 import html
+import functools
 from typing import Any, Dict, List, Optional, Union
 
 
@@ -120,29 +121,8 @@ class InputSanitizer:
         if not isinstance(input_str, str):
             raise ValueError("Input must be a string")
         
-        # Trim whitespace and limit length
-        sanitized = input_str.strip()[:max_length]
-        
-        # Check for SQL injection patterns
-        for pattern in cls.SQL_INJECTION_PATTERNS:
-            if re.search(pattern, sanitized, re.IGNORECASE):
-                raise ValueError(f"Input contains potentially malicious SQL pattern: {pattern}")
-        
-        # Check for XSS patterns
-        for pattern in cls.XSS_PATTERNS:
-            if re.search(pattern, sanitized, re.IGNORECASE):
-                raise ValueError(f"Input contains potentially malicious XSS pattern: {pattern}")
-        
-        # Check for command injection patterns
-        for pattern in cls.COMMAND_INJECTION_PATTERNS:
-            if re.search(pattern, sanitized, re.IGNORECASE):
-                raise ValueError(f"Input contains potentially malicious command injection pattern: {pattern}")
-        
-        # HTML escape if not allowing HTML
-        if not allow_html:
-            sanitized = html.escape(sanitized)
-        
-        return sanitized
+        # Names, room titles and commands repeat constantly; rejected input isn't cached
+        return _sanitize_string_cached(input_str, max_length, allow_html)
     
     @classmethod
     def sanitize_username(cls, username: str) -> str:
@@ -292,6 +272,38 @@ class InputSanitizer:
         return cls.sanitize_string(json_str, max_length=1000)
 
 
+def _compile_patterns(patterns: List[str]):
+    """One combined regex for a single-pass check, plus each pattern to name the one that hit"""
+    combined = re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+    return combined, [(p, re.compile(p, re.IGNORECASE)) for p in patterns]
+
+
+_PATTERN_CHECKS = [
+    ('SQL', _compile_patterns(InputSanitizer.SQL_INJECTION_PATTERNS)),
+    ('XSS', _compile_patterns(InputSanitizer.XSS_PATTERNS)),
+    ('command injection', _compile_patterns(InputSanitizer.COMMAND_INJECTION_PATTERNS)),
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize_string_cached(input_str: str, max_length: int, allow_html: bool) -> str:
+    """Body of InputSanitizer.sanitize_string, memoized on its arguments"""
+    # Trim whitespace and limit length
+    sanitized = input_str.strip()[:max_length]
+    
+    # Check for SQL injection, XSS and command injection patterns, in that order
+    for kind, (combined, patterns) in _PATTERN_CHECKS:
+        if combined.search(sanitized):
+            pattern = next(p for p, regex in patterns if regex.search(sanitized))
+            raise ValueError(f"Input contains potentially malicious {kind} pattern: {pattern}")
+    
+    # HTML escape if not allowing HTML
+    if not allow_html:
+        sanitized = html.escape(sanitized)
+    
+    return sanitized
+
+
 # Convenience functions for common sanitization tasks
 def sanitize_user_input(input_str: str) -> str:
     """Quick sanitization for general user input"""
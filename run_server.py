@@ -15,6 +15,7 @@ from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from server import game_server
+from database import db
 from debug_logger import debug_logger
 
 def load_config(config_file: str = "config.yaml") -> dict:
@@ -64,6 +65,13 @@ def apply_config(config: dict):
         # game_server.db.pg_user = pg_config.get('username', 'sshrpg_user')
         # game_server.db.pg_password = pg_config.get('password', 'sshrpg_password')
     
+    pool_config = db_config.get('pool', {})
+    if pool_config:
+        db.pool_min_size = pool_config.get('min_size', db.pool_min_size)
+        db.pool_max_size = pool_config.get('max_size', db.pool_max_size)
+        db.pool_max_inactive_lifetime = pool_config.get('max_inactive_lifetime', db.pool_max_inactive_lifetime)
+        db.command_timeout = pool_config.get('command_timeout', db.command_timeout)
+    
     print(f"Configuration applied:")
     print(f"  Max players: {game_server.max_players}")
     print(f"  SSH port: {game_server.ssh_port}")
@@ -49,7 +49,8 @@ class GameServer:
         try:
             print("Starting SSH RPG Server...")
             
-            # Initialize database
+            # Initialize database; admin edit statements are warmed along with the built-in ones
+            self.db.register_warm_statements(AdminSystem.WARM_STATEMENTS)
             await self.db.connect()
             await self.db.create_tables()
             
@@ -302,8 +303,8 @@ class GameServer:
             character_data = session.get_character_data()
             
             if character_data:
-                # Save character to database
-                char_id = await self.db.create_character(
+                # Save character with its derived stats in one insert; the stored row becomes the live character
+                connection.character = await self.db.create_character(
                     connection.user_id,
                     character_data['name'],
                     character_data['race'],
@@ -314,23 +315,15 @@ class GameServer:
                         'constitution': character_data['constitution'],
                         'intelligence': character_data['intelligence'],
                         'wisdom': character_data['wisdom'],
-                        'charisma': character_data['charisma']
+                        'charisma': character_data['charisma'],
+                        'health': character_data['health'],
+                        'max_health': character_data['max_health'],
+                        'mana': character_data['mana'],
+                        'max_mana': character_data['max_mana'],
+                        'inventory': character_data['inventory']
                     }
                 )
                 
-                # Update character data with ID and derived stats
-                character_data['id'] = char_id
-                connection.character = character_data
-                
-                # Update character in database with derived stats
-                await self.db.update_character(char_id, {
-                    'health': character_data['health'],
-                    'max_health': character_data['max_health'],
-                    'mana': character_data['mana'],
-                    'max_mana': character_data['max_mana'],
-                    'inventory': character_data['inventory']
-                })
-                
                 # Clean up character creation session
                 connection.is_in_character_creation = False
                 del self.character_creation_sessions[connection_id]
@@ -382,14 +375,13 @@ class GameServer:
             await self._disconnect_player(connection)
             return
         
-        # Check for admin commands first
-        if self.admin_system and self.admin_system.is_admin_command(input_text):
-            if self.game_engine:
-                player = self.game_engine.players.get(connection.user_id)
-                if player:
-                    handled = await self.admin_system.process_command(player, input_text)
-                    if handled:
-                        return
+        # Check for admin commands first (process_command parses the line once and rejects non-admin input)
+        if self.admin_system and self.game_engine and input_text.startswith('/'):
+            player = self.game_engine.players.get(connection.user_id)
+            if player:
+                handled = await self.admin_system.process_command(player, input_text)
+                if handled:
+                    return
         
         # Process regular game command
         if self.game_engine:
@@ -44,7 +44,7 @@ async def create_admin_character():
     )
     
     # Create character in database
-    char_id = await db.create_character(
+    character = await db.create_character(
         user_id=user_id,
         name=character_data['name'],
         race=character_data['race'],
@@ -52,7 +52,7 @@ async def create_admin_character():
         stats=character_data
     )
     
-    print(f"Created character 'AdminHero' with ID: {char_id}")
+    print(f"Created character 'AdminHero' with ID: {character['id']}")
 
 if __name__ == "__main__":
     asyncio.run(create_admin_character())
\ No newline at end of file
@@ -65,13 +65,10 @@ async def create_currency_items():
         }
     ]
     
-    for currency in currencies:
-        await db.create_item(
-            currency['name'], 
-            currency['description'], 
-            currency['type'], 
-            stats=currency['stats']
-        )
+    await db.bulk_create_items([
+        (currency['name'], currency['description'], currency['type'], {}, currency['stats'])
+        for currency in currencies
+    ])
     
     print("Currency items created.")
 
@@ -96,7 +96,7 @@ async def create_room_monster_instances():
         for room in rooms:
             room_id = room['id']
             room_name = room['name']
-            monsters = json.loads(room['monsters']) if room['monsters'] else []
+            monsters = room['monsters'] or []
             
             for monster_id in monsters:
                 # Get monster base stats
@@ -123,7 +123,7 @@ async def verify_monster_placement():
         total_monsters = 0
         
         for room in rooms_with_monsters:
-            monster_ids = json.loads(room['monsters']) if isinstance(room['monsters'], str) else room['monsters']
+            monster_ids = room['monsters']
             total_monsters += len(monster_ids)
             
             monster_names = []